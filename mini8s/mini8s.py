@@ -11,22 +11,38 @@ import os
 import requests
 import json
 import io
-from PIL import Image, ImageSequence
+from PIL import Image, ImageSequence, GifImagePlugin
 import time
 from datetime import datetime
 import sys
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
+from email.utils import parsedate_to_datetime
 import pygame.image
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import pickle
+import collections
 import pygame.freetype
 import random
 import math
 import re
 import platform
 import zipfile
+import hashlib
+import functools
 import shutil
+import weakref
+import mmap
+import zlib
+import html
+import urllib3
+try:
+    import numpy  # Optional (pip install numpy), makes diffing radar frames a lot cheaper
+except ImportError:
+    numpy = None
 GUST_PATTERN = re.compile(r'gust(?:ing|s)?\s+(?:to\s+)?(\d+)', re.IGNORECASE)
 
 def log_fatal_error(error_message):
@@ -55,6 +71,281 @@ VERSION = "v0.3.99.2 [BETA]"
 RELEASE_TAG = "mini8s-v0.3.99.2"
 RELEASE_ARCH = "amd64" # SELF REMINDER TO CHANGE THIS FOR OTHER ARCHITECTURES
 
+# Shared HTTP client, every fetcher goes through here so a refresh reuses the same
+# keep-alive connections instead of doing a fresh DNS + TCP + TLS handshake per request.
+HTTP_USER_AGENT = f"Mini8s/{VERSION.split()[0]} (github.com/StarzainiaMini8s/mini8s)"
+HTTP_TIMEOUT = (10, 60)  # (connect, read) seconds
+HTTP_POOL_HOSTS = 8  # How many hosts keep a connection pool around (NWS, Nominatim, mesonet, GitHub..)
+HTTP_POOL_PER_HOST = 4  # Max connections open to any one host at once, more requests wait for one to free up
+HTTP_POOL_WAIT = 30  # Seconds a request waits for a free connection to its host before giving up
+
+FETCH_WORKERS = 6  # Threads for fetching conditions/forecast/alerts/radar side by side, keep it <= a few per host
+
+# Retry/backoff and a per-host circuit breaker, so one flaky upstream fails fast instead of
+# eating a full timeout on every request of every refresh.
+HTTP_RETRIES = 2  # Extra attempts after a connection error or a 5xx/429
+HTTP_BACKOFF_BASE = 0.5  # Seconds, doubled per attempt with full jitter
+HTTP_BACKOFF_MAX = 8
+CIRCUIT_FAILURE_THRESHOLD = 3  # Consecutive failures before we stop talking to a host for a bit
+CIRCUIT_OPEN_SECONDS = 60
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    pass
+
+# Offline record/replay, for benchmarking without live NWS/Nominatim/mesonet/GitHub.
+#   MINI8S_HTTP_MODE=record  saves every response the fetchers get into MINI8S_FIXTURE_DIR
+#   MINI8S_HTTP_MODE=replay  serves them back from there, nothing touches the network
+# MINI8S_REPLAY_LATENCY_MS and MINI8S_REPLAY_BANDWIDTH_KBPS fake a slow link in replay mode.
+HTTP_MODE = os.environ.get("MINI8S_HTTP_MODE", "").lower()
+FIXTURE_DIR = os.environ.get("MINI8S_FIXTURE_DIR", "fixtures")
+REPLAY_LATENCY_MS = float(os.environ.get("MINI8S_REPLAY_LATENCY_MS", "0") or 0)
+REPLAY_BANDWIDTH_KBPS = float(os.environ.get("MINI8S_REPLAY_BANDWIDTH_KBPS", "0") or 0)  # 0 = unlimited
+# Query params that just encode "now", left out of fixture keys so a recording replays at any time of day
+FIXTURE_VOLATILE_PARAMS = {'year', 'month', 'day', 'hour', 'minute'}
+
+_fixture_index_lock = threading.Lock()
+
+def get_fixture_key(method, url):
+    parsed = urlparse(url)
+    query = '&'.join(part for part in parsed.query.split('&') if part and part.split('=', 1)[0] not in FIXTURE_VOLATILE_PARAMS)
+    return f"{method} {parsed.scheme}://{parsed.netloc}{parsed.path}" + (f"?{query}" if query else "")
+
+def get_fixture_body_path(key):
+    return os.path.join(FIXTURE_DIR, hashlib.sha1(key.encode('utf-8')).hexdigest() + ".body")
+
+class PoolWaitMixin:
+    # requests never passes pool_timeout, so with pool_block a request would wait for a free
+    # connection forever (say a streamed response somewhere never got closed). This caps the wait.
+    def urlopen(self, *args, pool_timeout=None, **kwargs):
+        return super().urlopen(*args, pool_timeout=HTTP_POOL_WAIT if pool_timeout is None else pool_timeout, **kwargs)
+
+class BoundedHTTPConnectionPool(PoolWaitMixin, urllib3.HTTPConnectionPool):
+    pass
+
+class BoundedHTTPSConnectionPool(PoolWaitMixin, urllib3.HTTPSConnectionPool):
+    pass
+
+class BoundedHTTPAdapter(requests.adapters.HTTPAdapter):
+    # At most HTTP_POOL_PER_HOST connections to a host at once, waiting at most HTTP_POOL_WAIT for one
+    def __init__(self):
+        super().__init__(pool_connections=HTTP_POOL_HOSTS, pool_maxsize=HTTP_POOL_PER_HOST, pool_block=True)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': BoundedHTTPConnectionPool, 'https': BoundedHTTPSConnectionPool}
+
+class RecordingAdapter(BoundedHTTPAdapter):
+    # Normal pooled adapter that also writes each response into the fixture dir.
+    def send(self, request, stream=False, **kwargs):
+        response = super().send(request, stream=stream, **kwargs)
+        if response.status_code == 304:
+            return response  # Nothing new to save, the 200 we got earlier is already recorded
+        body = response.content  # Reads the whole thing, the caller can still iter_content() it afterwards
+        key = get_fixture_key(request.method, request.url)
+        headers = {name: value for name, value in response.headers.items()
+                   if name.lower() not in ('content-encoding', 'transfer-encoding', 'content-length', 'connection')}
+        with _fixture_index_lock:
+            os.makedirs(FIXTURE_DIR, exist_ok=True)
+            with open(get_fixture_body_path(key), 'wb') as f:
+                f.write(body)
+            index_path = os.path.join(FIXTURE_DIR, "index.json")
+            index = load_json_cache(index_path)
+            index[key] = {'status': response.status_code, 'reason': response.reason, 'headers': headers}
+            save_json_cache(index_path, index)
+        return response
+
+class ThrottledBody(io.BytesIO):
+    # Response body that trickles out at REPLAY_BANDWIDTH_KBPS
+    def read(self, size=-1):
+        data = super().read(size)
+        if REPLAY_BANDWIDTH_KBPS > 0 and data:
+            time.sleep(len(data) / (REPLAY_BANDWIDTH_KBPS * 1024))
+        return data
+
+class ReplayAdapter(requests.adapters.BaseAdapter):
+    # Serves recorded fixtures instead of going to the network.
+    def __init__(self):
+        super().__init__()
+        self.index = load_json_cache(os.path.join(FIXTURE_DIR, "index.json"))
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if REPLAY_LATENCY_MS > 0:
+            time.sleep(REPLAY_LATENCY_MS / 1000)
+        key = get_fixture_key(request.method, request.url)
+        entry = self.index.get(key)
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        if entry:
+            with open(get_fixture_body_path(key), 'rb') as f:
+                body = f.read()
+            response.status_code = entry['status']
+            response.reason = entry.get('reason')
+            response.headers = requests.structures.CaseInsensitiveDict(entry['headers'])
+        else:
+            print(f"Replay: no fixture for {key}")
+            body = b''
+            response.status_code = 404
+            response.reason = "No Fixture"
+        response.headers['Content-Length'] = str(len(body))
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.raw = ThrottledBody(body)
+        return response
+
+    def close(self):
+        pass
+
+_http_session = None
+_http_session_lock = threading.Lock()
+_fetch_pool = None
+_host_circuits = {}  # host -> {'failures': n, 'open_until': timestamp}
+_host_circuits_lock = threading.Lock()
+
+def get_http_session():
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            if HTTP_MODE == "replay":
+                print(f"HTTP replay mode, serving fixtures from {FIXTURE_DIR}")
+                adapter = ReplayAdapter()
+            else:
+                adapter_class = RecordingAdapter if HTTP_MODE == "record" else BoundedHTTPAdapter
+                if HTTP_MODE == "record":
+                    print(f"HTTP record mode, saving responses to {FIXTURE_DIR}")
+                adapter = adapter_class()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({'User-Agent': HTTP_USER_AGENT})
+            _http_session = session
+        return _http_session
+
+def get_fetch_pool():
+    global _fetch_pool
+    with _http_session_lock:
+        if _fetch_pool is None:
+            _fetch_pool = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="mini8s-fetch")
+        return _fetch_pool
+
+def check_host_circuit(host):
+    with _host_circuits_lock:
+        circuit = _host_circuits.get(host)
+        if circuit and time.time() < circuit['open_until']:
+            raise CircuitOpenError(f"{host} is failing, not retrying for another {circuit['open_until'] - time.time():.0f}s")
+
+def record_host_result(host, success):
+    with _host_circuits_lock:
+        circuit = _host_circuits.setdefault(host, {'failures': 0, 'open_until': 0})
+        if success:
+            circuit['failures'] = 0
+            return
+        circuit['failures'] += 1
+        # Stays open until a request after the cooldown succeeds, one more failure re-opens it
+        if circuit['failures'] >= CIRCUIT_FAILURE_THRESHOLD:
+            if circuit['failures'] == CIRCUIT_FAILURE_THRESHOLD:
+                print(f"{host} failed {circuit['failures']} times in a row, backing off for {CIRCUIT_OPEN_SECONDS}s")
+            circuit['open_until'] = time.time() + CIRCUIT_OPEN_SECONDS
+
+def get_backoff_delay(attempt, response=None):
+    # Honour a short Retry-After, otherwise exponential backoff with full jitter
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    if retry_after and retry_after.isdigit() and int(retry_after) <= HTTP_BACKOFF_MAX:
+        return int(retry_after)
+    return random.uniform(0, min(HTTP_BACKOFF_MAX, HTTP_BACKOFF_BASE * (2 ** attempt)))
+
+def http_get(url, headers=None, timeout=HTTP_TIMEOUT, **kwargs):
+    # Drop-in for requests.get(), just pooled and with our default User-Agent/timeouts,
+    # plus retries for connection errors/5xx and a fail-fast when the host is known to be down.
+    host = urlparse(url).netloc
+    for attempt in range(HTTP_RETRIES + 1):
+        check_host_circuit(host)
+        try:
+            response = get_http_session().get(url, headers=headers, timeout=timeout, **kwargs)
+        except urllib3.exceptions.EmptyPoolError as e:
+            # Our own connections to the host are all busy, nothing wrong with the host itself
+            raise requests.exceptions.ConnectionError(f"No free connection to {host} after {HTTP_POOL_WAIT}s") from e
+        except requests.exceptions.ReadTimeout:
+            # Already waited the whole read timeout, retrying would just double the stall
+            record_host_result(host, False)
+            raise
+        except requests.exceptions.ConnectionError:
+            record_host_result(host, False)
+            if attempt == HTTP_RETRIES:
+                raise
+            time.sleep(get_backoff_delay(attempt))
+            continue
+        if response.status_code >= 500 or response.status_code == 429:
+            record_host_result(host, False)
+            if attempt == HTTP_RETRIES:
+                return response  # Let the caller's raise_for_status() deal with it
+            delay = get_backoff_delay(attempt, response)
+            response.close()
+            time.sleep(delay)
+            continue
+        record_host_result(host, True)
+        return response
+
+# Conditional request cache for the NWS JSON endpoints (alerts, forecast, hourly, observations).
+# Keeps the last body with its ETag/Last-Modified and freshness, keyed by URL.
+_http_json_cache = {}
+_http_json_cache_lock = threading.Lock()
+
+def get_response_freshness(response):
+    # How many seconds the server says this response stays fresh (Cache-Control beats Expires).
+    cache_control = response.headers.get('Cache-Control', '').lower()
+    if 'no-cache' in cache_control or 'no-store' in cache_control:
+        return 0
+    max_age_match = re.search(r'max-age=(\d+)', cache_control)
+    if max_age_match:
+        return int(max_age_match.group(1))
+    expires = response.headers.get('Expires')
+    if expires:
+        try:
+            # Measure against the server's own Date header so a wrong local clock doesn't matter.
+            server_date = response.headers.get('Date')
+            now = parsedate_to_datetime(server_date) if server_date else datetime.now(parsedate_to_datetime(expires).tzinfo)
+            return max(0, int((parsedate_to_datetime(expires) - now).total_seconds()))
+        except (TypeError, ValueError):
+            return 0
+    return 0
+
+def http_get_json(url):
+    """
+    GET a JSON endpoint with validators and freshness honoured.
+    Returns (data, unchanged), unchanged is True when the body is the same one we already had.
+    """
+    with _http_json_cache_lock:
+        entry = _http_json_cache.get(url)
+    if entry and time.time() < entry['fresh_until']:
+        return entry['data'], True
+
+    headers = {}
+    if entry:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+    response = http_get(url, headers=headers)
+
+    if response.status_code == 304 and entry:
+        entry['fresh_until'] = time.time() + get_response_freshness(response)
+        return entry['data'], True
+
+    response.raise_for_status()
+    data = response.json()
+    etag = response.headers.get('ETag')
+    unchanged = bool(entry and etag and etag == entry.get('etag'))
+    if unchanged:
+        data = entry['data']
+    with _http_json_cache_lock:
+        _http_json_cache[url] = {
+            'data': data,
+            'etag': etag,
+            'last_modified': response.headers.get('Last-Modified'),
+            'fresh_until': time.time() + get_response_freshness(response)
+        }
+    return data, unchanged
+
 try:
     with open('var/motd.json', 'r') as f:
         MOTD_CONFIG = json.load(f)
@@ -90,24 +381,283 @@ def create_gradient_text_surface(text, font_path, font_size, color_top, color_bo
     final_surface = pygame.Surface((full_width, full_height), pygame.SRCALPHA)
 
     if outline_color and outline_width > 0:
-        for dx in range(-outline_width, outline_width + 1):
-            for dy in range(-outline_width, outline_width + 1):
-                if dx != 0 or dy != 0:
-                    outline_surface = font.render(text, True, outline_color)
-                    final_surface.blit(outline_surface, (outline_width + dx, outline_width + dy))
-    gradient_surface = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
-    for y in range(text_surface.get_height()):
-        ratio = y / text_surface.get_height() if text_surface.get_height() > 0 else 0
+        final_surface.blit(font.render(text, True, outline_color), (0, 0))
+        dilate_text_outline(final_surface, outline_width)
+    final_surface.blit(fill_text_gradient(text_surface, color_top, color_bottom), (outline_width, outline_width))
+    return final_surface
+
+def dilate_text_outline(surface, outline_width):
+    # Outlines: the text goes onto surface once, at (0, 0) in the outline colour, and this spreads it
+    # 2 * outline_width right and down. Same as drawing it at every (dx, dy) in the square around
+    # the fill, but each BLEND_RGBA_MAX pass doubles the reach, so it's a few blits instead of
+    # (2w + 1)^2 renders. Works on whatever got drawn, italics and all.
+    span = 2 * outline_width
+    for axis in (0, 1):
+        reach = 0
+        while reach < span:
+            step = min(reach + 1, span - reach)
+            surface.blit(surface.copy(), (step, 0) if axis == 0 else (0, step), special_flags=pygame.BLEND_RGBA_MAX)
+            reach += step
+    return surface
+
+def fill_text_gradient(text_surface, color_top, color_bottom):
+    # Top to bottom gradient, solid wherever the rendered text has any alpha at all
+    width, height = text_surface.get_size()
+    gradient_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    for y in range(height):
+        ratio = y / height
         r = int(color_top[0] * (1 - ratio) + color_bottom[0] * ratio)
         g = int(color_top[1] * (1 - ratio) + color_bottom[1] * ratio)
         b = int(color_top[2] * (1 - ratio) + color_bottom[2] * ratio)
+        gradient_surface.fill((r, g, b, 255), (0, y, width, 1))
+    text_mask = pygame.mask.from_surface(text_surface, threshold=0)
+    return text_mask.to_surface(setsurface=gradient_surface, unsetcolor=(0, 0, 0, 0))
 
-        for x in range(text_surface.get_width()):
-            if text_surface.get_at((x, y))[3] > 0:
-                gradient_surface.set_at((x, y), (r, g, b, 255))
-
-    final_surface.blit(gradient_surface, (outline_width, outline_width))
-    return final_surface
+def fetch_forecast_for_point(lat, lon):
+    _, _, _, forecast_url, _ = get_forecast_grid_point(lat, lon)
+    if not forecast_url:
+        return forecast_url, None, None, False
+    forecast_text_val, forecast_periods_data, forecast_unchanged = fetch_weather_forecast(forecast_url)
+    return forecast_url, forecast_text_val, forecast_periods_data, forecast_unchanged
+
+def gather_weather_data(zip_code, progress_queue=None, use_radar_cache=False, progressive_radar=False):
+    # Geocode first, then everything that only needs lat/lon/state goes out at once:
+    # alerts, conditions, forecast and the radar GIF. The tropical loop waits on the alerts.
+    # use_radar_cache: if the loops on disk are fresh, use those as they are and skip the radar
+    # download ('radar_from_cache' is set in the result, a normal refresh should follow soon).
+    # progressive_radar: only get the newest radar frame ('radar_partial' is set in the result,
+    # fill_radar_loops() gets the rest).
+    pool = get_fetch_pool()
+    lat, lon, state, location_name = get_coordinates_from_zip(zip_code)
+    build_radar_loop_url = lambda frames, end_time: build_radar_url(lat, lon, zip_code=zip_code, frames=frames, end_time=end_time)
+    build_tropical_loop_url = lambda frames, end_time: build_tropical_url(lat, lon, zip_code=zip_code, frames=frames, end_time=end_time)
+    radar_cached = bool(use_radar_cache and lat and lon and restore_radar_loop('radar', build_radar_loop_url))
+
+    alerts_future = pool.submit(get_weather_alerts, zip_code=zip_code, state=state)
+    conditions_future = forecast_future = radar_update_future = newest_radar_future = None
+    if lat and lon:
+        if progressive_radar and not radar_cached:
+            newest_radar_future = pool.submit(open_newest_radar_frame, build_radar_loop_url)
+        elif not radar_cached:
+            radar_update_future = pool.submit(fetch_radar_loop_update, 'radar', build_radar_loop_url)
+        conditions_future = pool.submit(fetch_current_conditions, lat, lon)
+        forecast_future = pool.submit(fetch_forecast_for_point, lat, lon)
+
+    alert_list, _, alert_type_val, is_tropical, alerts_unchanged, alerts_error = alerts_future.result()
+
+    # Check for redmode (Hurricane Watch/Warning)
+    is_redmode = False
+    if alert_type_val:
+        alert_upper = alert_type_val.upper()
+        if "HURRICANE WATCH" in alert_upper or "HURRICANE WARNING" in alert_upper:
+            is_redmode = True
+            is_tropical = True  # Redmode always enables tropical mode
+
+    if radar_cached:
+        # Only good as is if it was decoded for the same mode, and has its tropical loop if that's needed
+        with _radar_loops_lock:
+            radar_cached = _radar_loops['radar']['is_tropical'] == is_tropical
+        if radar_cached and is_tropical:
+            radar_cached = restore_radar_loop('tropical', build_tropical_loop_url)
+
+    # Start tropical download in background if needed
+    tropical_future = None
+    if is_tropical and lat and lon and not radar_cached and not newest_radar_future:
+        tropical_future = pool.submit(fetch_tropical_loop, lat, lon, zip_code)
+
+    current_conditions_data, conditions_unchanged = None, False
+    if conditions_future:
+        current_conditions_data, conditions_unchanged = conditions_future.result()
+    forecast_url, forecast_text_val, forecast_periods_data, forecast_unchanged = None, None, None, False
+    if forecast_future:
+        forecast_url, forecast_text_val, forecast_periods_data, forecast_unchanged = forecast_future.result()
+
+    # Update loading screen (loadingradardata)
+    def report_radar_progress(frames_done=0, frames_total=0, frames=None):
+        if progress_queue:
+            try:
+                progress_queue.put_nowait({'stage': 'loading_radar', 'frames_done': frames_done, 'frames_total': frames_total})
+            except:
+                pass
+    radar_data_tuple = None
+    radar_partial = False
+    if radar_cached:
+        radar_data_tuple = get_radar_rings_data(('radar', 'tropical') if is_tropical else ('radar',))
+    else:
+        report_radar_progress()
+        if newest_radar_future:
+            # Same crop/offset as the loop fill_radar_loops() will put behind it
+            newest_loop, newest_durations = fetch_newest_radar_frame(build_radar_loop_url, is_tropical=is_tropical,
+                                                                     gif_stream_future=newest_radar_future)
+            if newest_loop:
+                radar_data_tuple = [(newest_loop, newest_durations, 0)]
+                radar_partial = True
+            elif is_tropical and lat and lon:
+                # Didn't work, do it the long way
+                tropical_future = pool.submit(fetch_tropical_loop, lat, lon, zip_code)
+
+        # Radar image.. (redmode, is_tropical, etc..)
+        if not radar_data_tuple:
+            radar_data_tuple = fetch_radar_image(zip_code, is_tropical=is_tropical, radar_update_future=radar_update_future,
+                                                 tropical_future=tropical_future, progress_callback=report_radar_progress)
+
+    failed_groups = set()
+    if not lat or not lon:
+        failed_groups.update(WeatherDataStore.FIELD_GROUPS)
+    if current_conditions_data is None:
+        failed_groups.add('conditions')
+    if forecast_periods_data is None:
+        failed_groups.add('forecast')
+    if alerts_error:
+        failed_groups.add('alerts')
+    if not radar_data_tuple:
+        failed_groups.add('radar')
+        if use_radar_cache and lat and lon:
+            # Nothing to fall back on in memory yet at startup, so try the disk before giving up (the
+            # store serves it from there). Counts as started from the cache, so the refresh comes soon.
+            radar_cached = bool(restore_stale_radar_loops(lat, lon, zip_code, is_tropical)[0])
+
+    # List of vars used here
+    weather_data = {
+        'zip_code': zip_code,
+        'lat': lat,
+        'lon': lon,
+        'state': state,
+        'location_name': location_name,
+        'forecast_url': forecast_url,
+        'current_conditions': current_conditions_data,
+        'alert_list': alert_list,
+        'alert_type': alert_type_val,
+        'is_tropical': is_tropical,
+        'is_redmode': is_redmode,
+        'forecast_text': forecast_text_val,
+        'forecast_periods': forecast_periods_data,
+        'radar_data': radar_data_tuple,
+        'radar_from_cache': radar_cached,
+        'radar_partial': radar_partial,
+        # NWS said 304/still fresh, the main thread can keep its old panels/ticker
+        'conditions_unchanged': conditions_unchanged,
+        'alerts_unchanged': alerts_unchanged,
+        'forecast_unchanged': forecast_unchanged
+    }
+    # Whatever failed this time gets filled in with the last good copy
+    return get_weather_store(zip_code).merge(weather_data, failed_groups)
+
+def get_stored_weather_data(zip_code):
+    # Startup without waiting on the network: the WeatherDataStore's last good groups plus the
+    # newest radar loop on disk (see restore_stale_radar_loops). It goes out as 'radar_from_cache',
+    # so the main loop starts a full refresh right away. None if there isn't enough to show.
+    weather_data = get_weather_store(zip_code).stored_data()
+    if not weather_data:
+        return None
+    radar_data_tuple, radar_age = restore_stale_radar_loops(weather_data['lat'], weather_data['lon'], zip_code, weather_data['is_tropical'])
+    if not radar_data_tuple:
+        return None
+    weather_data['data_age']['radar'] = radar_age
+    weather_data.update({'zip_code': zip_code, 'radar_data': radar_data_tuple, 'radar_from_cache': True, 'radar_partial': False,
+                         'conditions_unchanged': False, 'alerts_unchanged': False, 'forecast_unchanged': False})
+    return weather_data
+
+class WeatherDataStore:
+    # Last good copy of each piece of weather data for one ZIP, so a failed fetch serves what we
+    # had (and says how old it is) instead of blanking a panel or dropping the radar.
+    # Everything but the radar frames is persisted, so a restart during an outage still has panels.
+    FIELD_GROUPS = {
+        'location': ('lat', 'lon', 'state', 'location_name'),
+        'conditions': ('current_conditions',),
+        'forecast': ('forecast_url', 'forecast_text', 'forecast_periods'),
+        'alerts': ('alert_list', 'alert_type', 'is_tropical', 'is_redmode'),
+        'radar': ('radar_data',)
+    }
+    # How stale a group is allowed to get before we'd rather show nothing.
+    # Alerts expire quickly, an old warning on screen is worse than none.
+    MAX_AGE = {'location': None, 'conditions': 6 * 3600, 'forecast': 24 * 3600, 'alerts': 2 * 3600, 'radar': 6 * 3600}
+
+    def __init__(self, zip_code, path=None):
+        self.zip_code = str(zip_code)
+        self.path = path or WEATHER_CACHE_PATH
+        self._lock = threading.Lock()
+        # group -> {'values': {...}, 'updated_at': timestamp}
+        self._groups = load_json_cache(self.path).get(self.zip_code, {})
+
+    def get_entry(self, group, now):
+        # The stored copy of a group if it's not past its MAX_AGE, call with the lock held
+        entry = self._groups.get(group)
+        max_age = self.MAX_AGE[group]
+        if not entry or (max_age is not None and now - entry['updated_at'] > max_age):
+            return None
+        return entry
+
+    def stored_data(self):
+        # Everything we have that's still usable as a weather_data dict, radar_data left out (the
+        # frames aren't persisted). None if we don't even have the location.
+        now = time.time()
+        weather_data = {'current_conditions': None, 'alert_list': [], 'alert_type': None, 'is_tropical': False,
+                        'is_redmode': False, 'forecast_url': None, 'forecast_text': None, 'forecast_periods': None}
+        data_age = {}
+        with self._lock:
+            for group in self.FIELD_GROUPS:
+                entry = self.get_entry(group, now)
+                if entry and group != 'radar':
+                    weather_data.update(entry['values'])
+                    data_age[group] = now - entry['updated_at']
+        if 'location' not in data_age or not weather_data['lat'] or not weather_data['lon']:
+            return None
+        print("Starting with stored data for " + ", ".join(f"{group} ({age / 60:.0f} min old)" for group, age in data_age.items()))
+        weather_data['data_age'] = data_age
+        return weather_data
+
+    def remember(self, group, values, updated_at):
+        # A copy of a group we got some other way (the radar loop off the disk), as if fetched at updated_at
+        with self._lock:
+            self._groups[group] = {'values': values, 'updated_at': updated_at}
+
+    def merge(self, weather_data, failed_groups):
+        now = time.time()
+        data_age = {}
+        with self._lock:
+            for group, fields in self.FIELD_GROUPS.items():
+                if group not in failed_groups:
+                    self._groups[group] = {'values': {field: weather_data.get(field) for field in fields}, 'updated_at': now}
+                    continue
+                entry = self.get_entry(group, now)
+                if not entry:
+                    continue
+                weather_data.update(entry['values'])
+                data_age[group] = now - entry['updated_at']
+                if group in ('conditions', 'alerts', 'forecast'):
+                    # It's the same copy the main thread is already showing
+                    weather_data[f'{group}_unchanged'] = True
+            persisted = {group: entry for group, entry in self._groups.items() if group != 'radar'}
+        if data_age:
+            print("Serving last good data for " + ", ".join(f"{group} ({age / 60:.0f} min old)" for group, age in data_age.items()))
+        weather_data['data_age'] = data_age
+        if len(data_age) < len(self.FIELD_GROUPS):
+            all_stores = load_json_cache(self.path)
+            all_stores[self.zip_code] = persisted
+            save_json_cache(self.path, all_stores)
+        return weather_data
+
+_weather_stores = {}
+_weather_stores_lock = threading.Lock()
+
+def get_weather_store(zip_code):
+    with _weather_stores_lock:
+        if str(zip_code) not in _weather_stores:
+            _weather_stores[str(zip_code)] = WeatherDataStore(zip_code)
+        return _weather_stores[str(zip_code)]
+
+def describe_data_age(data_age, elapsed=0):
+    # The line shown under the logo while some of what's on screen is the store's last good copy,
+    # "Old data: radar 25 min, alerts 1 hr 10 min". None if it's all fresh.
+    # elapsed is how long ago data_age was worked out.
+    parts = []
+    for group, age in data_age.items():
+        if group == 'location':
+            continue  # Doesn't go stale
+        minutes = int(age + elapsed) // 60
+        parts.append(f"{group} {minutes // 60} hr {minutes % 60} min" if minutes >= 60 else f"{group} {minutes} min")
+    return "Old data: " + ", ".join(parts) if parts else None
 
 class WeatherDataWorker(threading.Thread):
 
@@ -125,128 +675,17 @@ class WeatherDataWorker(threading.Thread):
             if current_time - self.last_refresh_time >= WEATHER_REFRESH_INTERVAL:
                 try:
                     print("Background thread: Starting weather data refresh...")
-                    lat, lon, state, location_name = get_coordinates_from_zip(self.zip_code)
-
-                    if lat and lon:
-                        _, _, _, forecast_url, _ = get_forecast_grid_point(lat, lon)
-                        current_conditions_data = fetch_current_conditions(lat, lon)
-                        alert_list, _, alert_type_val, is_tropical = get_weather_alerts(zip_code=self.zip_code, state=state)
+                    weather_data = gather_weather_data(self.zip_code)
 
+                    if weather_data['lat'] and weather_data['lon']:
                         # Handle first run and log initial alerts only
                         if self.first_run:
-                            log_initial_alerts(alert_list)
+                            log_initial_alerts(weather_data['alert_list'])
                             self.first_run = False
                         else:
-                            check_for_new_alerts(alert_list)
-
-                        forecast_text_val, forecast_periods_data = fetch_weather_forecast(forecast_url)
-
-                        # Check for redmode (Hurricane Watch/Warning)
-                        is_redmode = False
-                        if alert_type_val:
-                            alert_upper = alert_type_val.upper()
-                            if "HURRICANE WATCH" in alert_upper or "HURRICANE WARNING" in alert_upper:
-                                is_redmode = True
-                                is_tropical = True  # Redmode always enables tropical mode
-
-                        # Start tropical download in background if needed
-                        tropical_thread = None
-                        tropical_download_results = [None, None]
-                        if is_tropical:
-                            def download_tropical_gif():
-                                try:
-                                    lat_val, lon_val = lat, lon
-                                    tropical_url = build_tropical_url(lat_val, lon_val, zip_code=self.zip_code)
-
-                                    response = requests.get(tropical_url, stream=True, timeout=60)
-                                    response.raise_for_status()
-                                    html_buffer = b''
-                                    found_link = False
-                                    for chunk in response.iter_content(chunk_size=1024):
-                                        if chunk:
-                                            html_buffer += chunk
-                                            if b'Download as Animated Gif' in html_buffer:
-                                                found_link = True
-                                                break
-                                    response.close()
-                                    if not found_link:
-                                        print("Could not find the tropical GIF download link on the page.")
-                                        return
-                                    html_content = html_buffer.decode('utf-8', errors='ignore')
-                                    soup = BeautifulSoup(html_content, 'html.parser')
-                                    download_link_element = soup.find('a', string='Download as Animated Gif')
-                                    if download_link_element:
-                                        relative_gif_path = download_link_element.get('href')
-                                        if relative_gif_path:
-                                            base_site_url = "https://mesonet.agron.iastate.edu/GIS/apps/rview/"
-                                            full_gif_url = urljoin(base_site_url, relative_gif_path)
-                                            gif_response = requests.get(full_gif_url, stream=True, timeout=240)
-                                            gif_response.raise_for_status()
-                                            gif_bytes_in_memory = gif_response.content
-                                            gif_file_stream = io.BytesIO(gif_bytes_in_memory)
-                                            pil_gif = Image.open(gif_file_stream)
-                                            pygame_frames = []
-                                            frame_durations_ms = []
-                                            for i, frame in enumerate(ImageSequence.Iterator(pil_gif)):
-                                                frame_rgba = frame.convert('RGBA')
-                                                width, height = frame_rgba.size
-                                                crop_top = int(height * 0.1)
-                                                cropped_frame = frame_rgba.crop((0, crop_top, width, height))
-                                                cropped_width, cropped_height = cropped_frame.size
-                                                aspect_ratio = cropped_width / cropped_height
-                                                screen_aspect = SCREEN_WIDTH / SCREEN_HEIGHT
-                                                if aspect_ratio > screen_aspect:
-                                                    new_height = SCREEN_HEIGHT
-                                                    new_width = int(SCREEN_HEIGHT * aspect_ratio)
-                                                else:
-                                                    new_width = SCREEN_WIDTH
-                                                    new_height = int(SCREEN_WIDTH / aspect_ratio)
-
-                                                if QUALITY_FACTOR < 1.0:
-                                                    intermediate_width = int(new_width * QUALITY_FACTOR)
-                                                    intermediate_height = int(new_height * QUALITY_FACTOR)
-                                                    downscaled_frame = cropped_frame.resize((intermediate_width, intermediate_height), Image.Resampling.LANCZOS)
-                                                    scaled_frame = downscaled_frame.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                                                else:
-                                                    scaled_frame = cropped_frame.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                                                pygame_surface = pygame.image.frombytes(scaled_frame.tobytes(), scaled_frame.size, scaled_frame.mode).convert_alpha()
-                                                offset_y = 40
-                                                final_surface = pygame.Surface((pygame_surface.get_width(), pygame_surface.get_height()), pygame.SRCALPHA)
-                                                final_surface.blit(pygame_surface, (0, offset_y))
-                                                pygame_frames.append(final_surface)
-                                                duration = frame.info.get('duration', 100)
-                                                if not isinstance(duration, (int, float)) or duration <= 0:
-                                                    duration = 100
-                                                frame_durations_ms.append(int(duration))
-                                            if pygame_frames and frame_durations_ms:
-                                                frame_durations_ms[-1] += 1500
-                                            tropical_download_results[0] = pygame_frames
-                                            tropical_download_results[1] = frame_durations_ms
-                                except Exception as e:
-                                    print(f"Error downloading tropical GIF: {e}")
-
-                            tropical_thread = threading.Thread(target=download_tropical_gif)
-                            tropical_thread.start()
-
-                        radar_data_tuple = fetch_radar_image(is_tropical=is_tropical, tropical_thread=tropical_thread, tropical_results=tropical_download_results)
-
-                        # List of vars used here
-                        weather_data = {
-                            'lat': lat,
-                            'lon': lon,
-                            'state': state,
-                            'location_name': location_name,
-                            'forecast_url': forecast_url,
-                            'current_conditions': current_conditions_data,
-                            'alert_list': alert_list,
-                            'alert_type': alert_type_val,
-                            'is_tropical': is_tropical,
-                            'is_redmode': is_redmode,
-                            'forecast_text': forecast_text_val,
-                            'forecast_periods': forecast_periods_data,
-                            'radar_data': radar_data_tuple,
-                            'refresh_time': current_time
-                        }
+                            check_for_new_alerts(weather_data['alert_list'])
+
+                        weather_data['refresh_time'] = current_time
                         try:
                             self.result_queue.put_nowait(weather_data)
                             print("Weather data refresh completed successfully")
@@ -317,151 +756,28 @@ def check_for_new_alerts(alert_list):
 
 class InitializationWorker(threading.Thread):
 # A worker thread so the main loading screen doesn't freeze.
-    def __init__(self, zip_code, result_queue, progress_queue, stop_event):
+    # update_queue is where the rest of the radar loop goes after a progressive start (the main loop's weather queue)
+    def __init__(self, zip_code, result_queue, progress_queue, stop_event, update_queue=None):
         super().__init__(daemon=True)
         self.zip_code = zip_code
         self.result_queue = result_queue
         self.progress_queue = progress_queue
         self.stop_event = stop_event
+        self.update_queue = update_queue
     
     def run(self):
         try:
-            # Coordinates getter
-            lat, lon, state, location_name = get_coordinates_from_zip(self.zip_code)
-            forecast_url = None
-            current_conditions_data = None
-            forecast_periods_data = None
-            
-            if lat and lon:
-                # Then, figure out where that is..
-                _, _, _, forecast_url, _ = get_forecast_grid_point(lat, lon)
-                current_conditions_data = fetch_current_conditions(lat, lon)
-            
-            # Alerts
-            alert_list, _, alert_type_val, is_tropical = get_weather_alerts(zip_code=self.zip_code, state=state)
-            log_initial_alerts(alert_list)
-            
-            # Forecast from NWS
-            forecast_text_val = None
-            if forecast_url:
-                forecast_text_val, forecast_periods_data = fetch_weather_forecast(forecast_url)
-            
-            # Redmode/Is_tropical.
-            is_redmode = False
-            tropical_thread = None
-            tropical_download_results = [None, None]
-
-            if alert_type_val:
-                alert_upper = alert_type_val.upper()
-                if "HURRICANE WATCH" in alert_upper or "HURRICANE WARNING" in alert_upper:
-                    is_redmode = True
-                    is_tropical = True  # Redmode always enables tropical mode
-            
-            # Start tropical download in background if needed..
-            if is_tropical:
-                def download_tropical_gif():
-                    try:
-                        lat_val, lon_val = lat, lon
-                        tropical_url = build_tropical_url(lat_val, lon_val, zip_code=self.zip_code)
-                        
-                        response = requests.get(tropical_url, stream=True, timeout=60)
-                        response.raise_for_status()
-                        html_buffer = b''
-                        found_link = False
-                        for chunk in response.iter_content(chunk_size=1024):
-                            if chunk:
-                                html_buffer += chunk
-                                if b'Download as Animated Gif' in html_buffer:
-                                    found_link = True
-                                    break
-                        response.close()
-                        if not found_link:
-                            print("Could not find the tropical GIF download link on the page.")
-                            return
-                        html_content = html_buffer.decode('utf-8', errors='ignore')
-                        soup = BeautifulSoup(html_content, 'html.parser')
-                        download_link_element = soup.find('a', string='Download as Animated Gif')
-                        if download_link_element:
-                            relative_gif_path = download_link_element.get('href')
-                            if relative_gif_path:
-                                base_site_url = "https://mesonet.agron.iastate.edu/GIS/apps/rview/"
-                                full_gif_url = urljoin(base_site_url, relative_gif_path)
-                                gif_response = requests.get(full_gif_url, stream=True, timeout=240)
-                                gif_response.raise_for_status()
-                                gif_bytes_in_memory = gif_response.content
-                                gif_file_stream = io.BytesIO(gif_bytes_in_memory)
-                                pil_gif = Image.open(gif_file_stream)
-                                pygame_frames = []
-                                frame_durations_ms = []
-                                for i, frame in enumerate(ImageSequence.Iterator(pil_gif)):
-                                    frame_rgba = frame.convert('RGBA')
-                                    width, height = frame_rgba.size
-                                    crop_top = int(height * 0.1)
-                                    cropped_frame = frame_rgba.crop((0, crop_top, width, height))
-                                    cropped_width, cropped_height = cropped_frame.size
-                                    aspect_ratio = cropped_width / cropped_height
-                                    screen_aspect = SCREEN_WIDTH / SCREEN_HEIGHT
-                                    if aspect_ratio > screen_aspect:
-                                        new_height = SCREEN_HEIGHT
-                                        new_width = int(SCREEN_HEIGHT * aspect_ratio)
-                                    else:
-                                        new_width = SCREEN_WIDTH
-                                        new_height = int(SCREEN_WIDTH / aspect_ratio)
-                                    
-                                    if QUALITY_FACTOR < 1.0:
-                                        intermediate_width = int(new_width * QUALITY_FACTOR)
-                                        intermediate_height = int(new_height * QUALITY_FACTOR)
-                                        downscaled_frame = cropped_frame.resize((intermediate_width, intermediate_height), Image.Resampling.LANCZOS)
-                                        scaled_frame = downscaled_frame.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                                    else:
-                                        scaled_frame = cropped_frame.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                                    pygame_surface = pygame.image.frombytes(scaled_frame.tobytes(), scaled_frame.size, scaled_frame.mode).convert_alpha()
-                                    offset_y = 40
-                                    final_surface = pygame.Surface((pygame_surface.get_width(), pygame_surface.get_height()), pygame.SRCALPHA)
-                                    final_surface.blit(pygame_surface, (0, offset_y))
-                                    pygame_frames.append(final_surface)
-                                    duration = frame.info.get('duration', 100)
-                                    if not isinstance(duration, (int, float)) or duration <= 0:
-                                        duration = 100
-                                    frame_durations_ms.append(int(duration))
-                                if pygame_frames and frame_durations_ms:
-                                    frame_durations_ms[-1] += 1500
-                                tropical_download_results[0] = pygame_frames
-                                tropical_download_results[1] = frame_durations_ms
-                    except Exception as e:
-                        print(f"Error downloading tropical GIF: {e}")
-                
-                tropical_thread = threading.Thread(target=download_tropical_gif)
-                tropical_thread.start()
-            
-            # Update loading screen (loadingradardata)
-            try:
-                self.progress_queue.put_nowait({'stage': 'loading_radar'})
-            except:
-                pass
-            
-            # Radar image.. (redmode, is_tropical, etc..)
-            radar_data_tuple = fetch_radar_image(is_tropical=is_tropical, tropical_thread=tropical_thread, tropical_results=tropical_download_results)
-            
-            # Package all results
-            init_data = {
-                'lat': lat,
-                'lon': lon,
-                'state': state,
-                'location_name': location_name,
-                'forecast_url': forecast_url,
-                'current_conditions': current_conditions_data,
-                'forecast_text': forecast_text_val,
-                'forecast_periods': forecast_periods_data,
-                'alert_list': alert_list,
-                'alert_type': alert_type_val,
-                'is_tropical': is_tropical,
-                'is_redmode': is_redmode,
-                'radar_data': radar_data_tuple,
-                'status': 'complete'
-            }
-            
+            # What we had last time goes up straight away if there's enough of it, the main loop refreshes right after
+            init_data = get_stored_weather_data(self.zip_code) if self.update_queue is not None else None
+            if not init_data:
+                init_data = gather_weather_data(self.zip_code, progress_queue=self.progress_queue, use_radar_cache=True,
+                                                progressive_radar=self.update_queue is not None)
+            log_initial_alerts(init_data['alert_list'])
+            init_data['status'] = 'complete'
+
             self.result_queue.put(init_data)
+            if init_data.get('radar_partial'):
+                fill_radar_loops(init_data, self.update_queue, self.stop_event)
         except Exception as e:
             traceback.print_exc()
             error_data = {
@@ -474,6 +790,60 @@ class InitializationWorker(threading.Thread):
             }
             self.result_queue.put(error_data)
 
+RADAR_PROGRESSIVE_STEP = 12  # Frames decoded between the partial loops sent to the main thread
+
+def fill_radar_loops(weather_data, result_queue, stop_event):
+    # Second half of a progressive start: weather_data went out with just the newest radar frame,
+    # now get the whole loop (and the tropical one if needed). Every RADAR_PROGRESSIVE_STEP frames the
+    # main thread gets what's decoded so far with that newest frame on the end, then the full loop.
+    newest_loop, newest_durations, _ = weather_data['radar_data'][0]
+    frame_duration = newest_durations[-1] - 1500
+
+    def send(radar_data, wait):
+        # Same data as before apart from the radar, so the main thread keeps its panels and ticker
+        update = dict(weather_data, radar_data=radar_data, radar_partial=not wait,
+                      conditions_unchanged=True, alerts_unchanged=True, forecast_unchanged=True)
+        while not stop_event.is_set():
+            try:
+                if wait:
+                    result_queue.put(update, timeout=1)
+                else:
+                    result_queue.put_nowait(update)
+                return
+            except queue.Full:
+                if not wait:
+                    return  # Main thread is behind, the next one will do
+
+    # The frames decoded so far as a loop, rolled forward with just the new ones each time (rebuilding
+    # it from all of them would redo every diff), and the newest frame redone on the loop GIF's palette
+    # once the first frame shows which one that is
+    partial = {'loop': None, 'newest_frame': None}
+
+    def send_partial(frames_done, frames_total, frames):
+        if frames_done % RADAR_PROGRESSIVE_STEP == 0 and frames_done < frames_total:
+            if not partial['loop']:
+                partial['newest_frame'] = match_radar_frame(newest_loop.last_frame, frames[0])
+                partial['loop'] = RadarLoop.from_frames(frames[:frames_done], newest_loop.position)
+            else:
+                partial['loop'] = partial['loop'].roll(frames[len(partial['loop']):frames_done], frames_total)
+            # With the newest frame on the end, that's just two more diffs
+            partial_loop = partial['loop'].roll([partial['newest_frame']], frames_total + 1)
+            durations = [frame_duration] * len(partial_loop)
+            durations[-1] += 1500
+            send([(partial_loop, durations, 0)], wait=False)
+
+    pool = get_fetch_pool()
+    tropical_future = None
+    if weather_data['is_tropical']:
+        tropical_future = pool.submit(fetch_tropical_loop, weather_data['lat'], weather_data['lon'], weather_data['zip_code'])
+    radar_data = fetch_radar_image(weather_data['zip_code'], is_tropical=weather_data['is_tropical'], tropical_future=tropical_future,
+                                   progress_callback=send_partial)
+    if radar_data:
+        send(radar_data, wait=True)
+        print("Radar loop filled in")
+    else:
+        print(f"Could not fill in the radar loop: {getattr(fetch_radar_image, 'last_error', 'unknown error')}")
+
 def log_initial_alerts(alert_list):
     global previous_alerts
     if alert_list:
@@ -541,10 +911,15 @@ BOTTOM_BAR_HEIGHT = 146
 # Global variables for user inputs
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
+# The window size. SCREEN_WIDTH/HEIGHT is the size the scene is rendered at, which is smaller
+# than this when QUALITY_FACTOR < 1, present_frame() scales it up to the window once per frame.
+DISPLAY_WIDTH = 1280
+DISPLAY_HEIGHT = 720
 ZIP_CODE = ""
 SHOW_FPS = False
 VSYNC_ENABLED = True  # VSync enabled by default (syncs to refresh rate..)
 QUALITY_FACTOR = 1.0  # Full quality is the default (100% rendering quality)
+RADAR_MEMORY_BUDGET_MB = 64  # "radar_memory_budget_mb" in config.json, see RadarPatchSet
 
 # Main/giant global configs blob.
 previous_alerts = set()
@@ -588,20 +963,88 @@ NUM_SUB_FRAMES_PER_SINGLE_FLIP_ANIMATION = (2 * PANEL_FLIP_ANIMATION_STEPS + 1)
 pre_rendered_conditions_surface = None
 pre_rendered_forecast_surface = None
 
-base_common_frames_global = []
-pre_rendered_frames_conditions = []
-pre_rendered_frames_forecast = []
-
 panel_shrink_cond_surfaces = []
 panel_expand_cond_surfaces = []
 panel_shrink_fcst_surfaces = []
 panel_expand_fcst_surfaces = []
 
+# On-disk caches for things that basically never change (ZIP geocodes, NWS grid points, etc..)
+CACHE_DIR = "cache"
+GEOCODE_CACHE_PATH = os.path.join(CACHE_DIR, "geocode.json")
+GEOCODE_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days, ZIP codes don't exactly move around.
+WEATHER_CACHE_PATH = os.path.join(CACHE_DIR, "weather_store.json")  # Last good panels/alerts, see WeatherDataStore
+
+_cache_file_lock = threading.Lock()
+
+def load_json_cache(path):
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    except Exception as e:
+        print(f"Warning: Could not read cache {path}: {e}")
+        return {}
+
+def save_json_cache(path, data):
+    # Write to a temp file and swap it in, so a crash mid-write never leaves a broken cache behind.
+    with _cache_file_lock:
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            temp_path = path + ".tmp"
+            with open(temp_path, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"Warning: Could not save cache {path}: {e}")
+
+_state_acronyms = None
+
+def get_state_acronyms():
+    global _state_acronyms
+    if _state_acronyms is None:
+        try:
+            with open('var/state-acros.json', 'r') as f:
+                _state_acronyms = json.load(f)
+        except Exception:
+            _state_acronyms = {}
+    return _state_acronyms
+
+_geocode_cache = None
+_geocode_lock = threading.Lock()
+
 def get_coordinates_from_zip(zip_code):
+    # Memory first, then cache/geocode.json, and only then Nominatim.
+    global _geocode_cache
+    zip_key = str(zip_code).strip()
+    with _geocode_lock:
+        if _geocode_cache is None:
+            _geocode_cache = load_json_cache(GEOCODE_CACHE_PATH)
+        entry = _geocode_cache.get(zip_key)
+        if entry and time.time() - entry.get('cached_at', 0) < GEOCODE_CACHE_TTL:
+            return entry['lat'], entry['lon'], entry['county'], entry['location_name']
+
+        latitude, longitude, county, location_name = lookup_coordinates_from_zip(zip_code)
+        if latitude is not None and longitude is not None:
+            _geocode_cache[zip_key] = {
+                'lat': latitude,
+                'lon': longitude,
+                'county': county,
+                'location_name': location_name,
+                'cached_at': time.time()
+            }
+            save_json_cache(GEOCODE_CACHE_PATH, _geocode_cache)
+        elif entry:
+            # Nominatim is down or rate-limiting us, an old geocode beats no geocode.
+            print(f"Using expired geocode for ZIP {zip_key}")
+            return entry['lat'], entry['lon'], entry['county'], entry['location_name']
+        return latitude, longitude, county, location_name
+
+def lookup_coordinates_from_zip(zip_code):
     try:
-        headers = {'User-Agent': 'mini8sv0.3.99family'}
         url = f"https://nominatim.openstreetmap.org/search?q={zip_code},USA&format=json&limit=1"
-        response = requests.get(url, headers=headers)
+        response = http_get(url)
         response.raise_for_status()
         data = response.json()
         if not data: 
@@ -630,12 +1073,7 @@ def get_coordinates_from_zip(zip_code):
         state_acronym = None
         
         # Load state acronym mapping first
-        state_mapping = {}
-        try:
-            with open('var/state-acros.json', 'r') as f:
-                state_mapping = json.load(f)
-        except Exception:
-            pass
+        state_mapping = get_state_acronyms()
         for part in display_parts:
             part_clean = part.strip()
             # Skip empty parts and obvious non-state parts
@@ -671,32 +1109,128 @@ def get_coordinates_from_zip(zip_code):
         get_coordinates_from_zip.last_error = error_message
         return None, None, None, None
 
-def get_forecast_grid_point(latitude, longitude):
+# NWS /points metadata (grid, forecast URLs, nearest station) is fixed for a location, so keep it around.
+POINTS_CACHE_PATH = os.path.join(CACHE_DIR, "points.json")
+POINTS_CACHE_TTL = 7 * 24 * 60 * 60  # A week, NWS only reshuffles grids/stations once in a blue moon.
+OBS_STATION_CANDIDATES = 5  # Nearest stations kept per location to fall back on
+OBS_STALE_HOURS = 2  # Older than this and we try the next station over
+
+_points_cache = None
+_points_lock = threading.Lock()
+
+def get_points_metadata(latitude, longitude):
+    # Returns the cached /points metadata dict for a location, or None if NWS can't be reached.
+    global _points_cache
+    points_key = f"{float(latitude):.4f},{float(longitude):.4f}"
+    with _points_lock:
+        if _points_cache is None:
+            _points_cache = load_json_cache(POINTS_CACHE_PATH)
+        entry = _points_cache.get(points_key)
+        if entry and time.time() - entry.get('cached_at', 0) < POINTS_CACHE_TTL:
+            return entry
+
+        metadata = lookup_points_metadata(points_key)
+        if metadata:
+            # Only keep it if the station lookup also worked, otherwise try again next refresh.
+            if metadata.get('station_url') or not metadata.get('observationStations'):
+                _points_cache[points_key] = metadata
+                save_json_cache(POINTS_CACHE_PATH, _points_cache)
+            return metadata
+        if entry:
+            print(f"Using expired NWS points data for {points_key}")
+        return entry
+
+def lookup_points_metadata(points_key):
     try:
-        url = f"https://api.weather.gov/points/{latitude},{longitude}"
-        response = requests.get(url, headers={'User-Agent': 'Mini8sWeatherApp/1.0'})
+        # 4 decimal places is what NWS wants, anything more just earns us a redirect.
+        response = http_get(f"https://api.weather.gov/points/{points_key}")
         response.raise_for_status()
-        data = response.json()
-        properties = data.get('properties', {})
-        return properties.get('gridId'), properties.get('gridX'), properties.get('gridY'), properties.get('forecast'), properties.get('forecastHourly')
+        properties = response.json().get('properties', {})
     except Exception as e:
-        print(f"Error getting grid point: {e}")
+        print(f"Error getting NWS points data: {e}")
+        return None
+    metadata = {
+        'gridId': properties.get('gridId'),
+        'gridX': properties.get('gridX'),
+        'gridY': properties.get('gridY'),
+        'forecast': properties.get('forecast'),
+        'forecastHourly': properties.get('forecastHourly'),
+        'observationStations': properties.get('observationStations'),
+        'station_url': None,
+        'station_id': None,
+        'stations': [],
+        'cached_at': time.time()
+    }
+    if metadata['observationStations']:
+        try:
+            stations_res = http_get(metadata['observationStations'])
+            stations_res.raise_for_status()
+            # NWS already sorts these nearest first
+            features = stations_res.json().get('features', [])
+            metadata['stations'] = [f['id'] for f in features if f.get('id')][:OBS_STATION_CANDIDATES]
+            if metadata['stations']:
+                metadata['station_url'] = metadata['stations'][0]
+                metadata['station_id'] = metadata['stations'][0].split('/')[-1]
+        except Exception as e:
+            print(f"Error getting observation stations: {e}")
+    return metadata
+
+def get_forecast_grid_point(latitude, longitude):
+    metadata = get_points_metadata(latitude, longitude)
+    if not metadata:
+        print("Error getting grid point: no NWS points data")
         return None, None, None, None, None
+    return metadata.get('gridId'), metadata.get('gridX'), metadata.get('gridY'), metadata.get('forecast'), metadata.get('forecastHourly')
+
+def get_observation_age_hours(obs_props):
+    timestamp_str = obs_props.get('timestamp')
+    if not timestamp_str:
+        return None
+    from datetime import datetime, timezone
+    obs_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+    return (datetime.now(timezone.utc) - obs_time).total_seconds() / 3600
+
+def fetch_latest_observation(station_urls):
+    # Walk the ranked station list, nearest first, until one has a recent observation.
+    # Returns (properties, status, unchanged). If every station is stale, the freshest one we saw wins.
+    best_props, best_age, best_unchanged = {}, None, False
+    obs_status = 'error'
+    for station_url in station_urls:
+        station_id = station_url.split('/')[-1]
+        try:
+            obs_data, obs_unchanged = http_get_json(station_url + "/observations/latest")
+        except requests.exceptions.HTTPError as e:
+            obs_status = e.response.status_code if e.response is not None else 'error'
+            print(f"No latest observation from {station_id} ({obs_status}), trying the next station...")
+            continue
+        except requests.exceptions.RequestException as e:
+            obs_status = 'error'
+            print(f"Error getting observation from {station_id}: {e}")
+            continue
+        obs_props = obs_data.get('properties', {})
+        hours_old = get_observation_age_hours(obs_props)
+        if hours_old is None:
+            continue
+        if hours_old <= OBS_STALE_HOURS:
+            return obs_props, 200, obs_unchanged
+        print(f"Warning: Observation data is {hours_old:.1f} hours old, contact airport {station_id} and let them know there is an issue with their ASOS/AWOS observation data!")
+        if best_age is None or hours_old < best_age:
+            best_props, best_age, best_unchanged = obs_props, hours_old, obs_unchanged
+            obs_status = 200
+    return best_props, obs_status, best_unchanged
 
 def fetch_current_conditions(latitude, longitude):
+    # Returns (conditions, unchanged), unchanged meaning NWS said the hourly forecast and observation are the same as last time
+    unchanged = False
     try:
-        points_url = f"https://api.weather.gov/points/{latitude},{longitude}"
-        points_response = requests.get(points_url, headers={'User-Agent': 'Mini8sWeatherApp/1.0'})
-        points_response.raise_for_status()
-        properties = points_response.json().get('properties', {})
-        hourly_url = properties.get('forecastHourly')
-        observation_stations_url = properties.get('observationStations')
+        metadata = get_points_metadata(latitude, longitude) or {}
+        hourly_url = metadata.get('forecastHourly')
+        station_url = metadata.get('station_url')
         if not hourly_url:
             print("Could not get hourly forecast URL.")
-            return None
-        hourly_res = requests.get(hourly_url, headers={'User-Agent': 'Mini8sWeatherApp/1.0'})
-        hourly_res.raise_for_status()
-        current_period = hourly_res.json().get('properties', {}).get('periods', [{}])[0]
+            return None, False
+        hourly_data, hourly_unchanged = http_get_json(hourly_url)
+        current_period = hourly_data.get('properties', {}).get('periods', [{}])[0]
         # This dictionary is first created with the 'forecast' data as a fallback.
         conditions_data = {
             "temperature": current_period.get('temperature', 'N/A'),
@@ -711,19 +1245,7 @@ def fetch_current_conditions(latitude, longitude):
             "visibility": "N/A",
             "gusts": "N/A"
         }
-        if not observation_stations_url:
-            print("Could not get observation stations URL, returning partial data.")
-            conditions_data['humidity'] = f"{current_period.get('relativeHumidity', {}).get('value', 'N/A')}%"
-            conditions_text = conditions_data['conditions']
-            if len(conditions_text) >= 25:
-                conditions_data['conditions_desc_font_size'] = 28
-            else:
-                conditions_data['conditions_desc_font_size'] = 40
-            return conditions_data
-        stations_res = requests.get(observation_stations_url, headers={'User-Agent': 'Mini8sWeatherApp/1.0'})
-        stations_res.raise_for_status()
-        features = stations_res.json().get('features', [])
-        if not features:
+        if not station_url:
             print("No observation stations found, returning partial data.")
             conditions_data['humidity'] = f"{current_period.get('relativeHumidity', {}).get('value', 'N/A')}%"
             conditions_text = conditions_data['conditions']
@@ -731,24 +1253,12 @@ def fetch_current_conditions(latitude, longitude):
                 conditions_data['conditions_desc_font_size'] = 28
             else:
                 conditions_data['conditions_desc_font_size'] = 40
-            return conditions_data
-        latest_obs_url = features[0].get('id') + "/observations/latest"
-        station_id = features[0].get('id').split('/')[-1] if features[0].get('id') else "Unknown"
-        obs_res = requests.get(latest_obs_url, headers={'User-Agent': 'Mini8sWeatherApp/1.0'})
-        obs_props = {}
-        if obs_res.status_code == 200:
-            obs_props = obs_res.json().get('properties', {})
+            return conditions_data, False
+        obs_props, obs_status, obs_unchanged = fetch_latest_observation(metadata.get('stations') or [station_url])
+        unchanged = hourly_unchanged and obs_unchanged
 
         timestamp_str = obs_props.get('timestamp')
         if timestamp_str:
-            from datetime import datetime, timezone
-            obs_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            current_time = datetime.now(timezone.utc)
-            time_diff = current_time - obs_time
-            hours_old = time_diff.total_seconds() / 3600
-            if hours_old > 2:
-                print(f"Warning: Observation data is {hours_old:.1f} hours old, contact airport {station_id} and let them know there is an issue with their ASOS/AWOS observation data!")
-
             temp_data = obs_props.get('temperature', {})
 
             if obs_props.get('textDescription'):
@@ -787,7 +1297,7 @@ def fetch_current_conditions(latitude, longitude):
                 else:
                     conditions_data['gusts'] = "None"
         else:
-            print(f"Unable to get data ({obs_res.status_code}), using partial data.")
+            print(f"Unable to get data ({obs_status}), using partial data.")
             conditions_data['humidity'] = f"{current_period.get('relativeHumidity', {}).get('value', 'N/A')}%"
         conditions_text = conditions_data['conditions'].lower()
         
@@ -834,31 +1344,32 @@ def fetch_current_conditions(latitude, longitude):
         else:
             conditions_data['conditions_desc_font_size'] = 40
 
-        return conditions_data
+        return conditions_data, unchanged
     except Exception as e:
         print(f"An error occurred in fetch_current_conditions: {e}")
-        return None
+        return None, False
 
 def fetch_weather_forecast(forecast_url=None):
+    # Returns (forecast_text, periods, unchanged), unchanged meaning NWS said it's the same as last time
     if not forecast_url:
         lat, lon, _, _ = get_coordinates_from_zip(ZIP_CODE)
         if lat and lon: _, _, _, forecast_url, _ = get_forecast_grid_point(lat, lon)
-    if not forecast_url: return "Weather data unavailable", None
+    if not forecast_url: return "Weather data unavailable", None, False
     try:
-        response = requests.get(forecast_url, headers={'User-Agent': 'Mini8sWeatherApp/1.0'})
-        response.raise_for_status()
-        data = response.json()
+        data, unchanged = http_get_json(forecast_url)
         periods = data.get('properties', {}).get('periods', [])
         forecast_text = ""
         if periods:
             for period in periods[:2]:
                 forecast_text += f"{period.get('name', '')}: {period.get('temperature', '')}°{period.get('temperatureUnit', '')} - {period.get('shortForecast', '')}. "
-        return forecast_text.strip(), periods
+        return forecast_text.strip(), periods, unchanged
     except Exception as e:
         print(f"Error fetching weather forecast: {e}")
-        return "Weather data temporarily unavailable", None
-def build_radar_url(lat, lon, zip_code=None):
-    current_time = datetime.now()
+        return "Weather data temporarily unavailable", None, False
+def build_radar_url(lat, lon, zip_code=None, frames=None, end_time=None):
+    # frames/end_time let the radar ring buffer ask for just the newest few timestamps.
+    current_time = end_time or datetime.now()
+    frames = frames or RADAR_LOOP_FRAMES
     base_url = "https://mesonet.agron.iastate.edu/GIS/apps/rview/warnings.phtml"
 
     global current_alert_level, alert_type_val
@@ -888,10 +1399,10 @@ def build_radar_url(lat, lon, zip_code=None):
         'minute': str(current_time.minute),
         'warngeo': 'both',
         'zoom': '250',
-        'imgsize': '1280x1024',
+        'imgsize': get_radar_image_param('standard'),
         'loop': '1',
-        'frames': '49',
-        'interval': '5',
+        'frames': str(frames),
+        'interval': str(RADAR_LOOP_INTERVAL),
         'filter': '0',
         'cu': '0',
         'sortcol': 'fcster',
@@ -934,8 +1445,9 @@ def determine_radar_layer_and_site(zip_code):
     return radar_layer, site_param
 
 
-def build_tropical_url(lat, lon, zip_code=None):
-    current_time = datetime.now()
+def build_tropical_url(lat, lon, zip_code=None, frames=None, end_time=None):
+    current_time = end_time or datetime.now()
+    frames = frames or RADAR_LOOP_FRAMES
     base_url = "https://mesonet.agron.iastate.edu/GIS/apps/rview/warnings.phtml"
 
     # Determine radar layer/site for the region
@@ -953,10 +1465,10 @@ def build_tropical_url(lat, lon, zip_code=None):
         'minute': str(current_time.minute),
         'warngeo': 'both',
         'zoom': '500',
-        'imgsize': '1280x1024',
+        'imgsize': get_radar_image_param('tropical'),
         'loop': '1',
-        'frames': '49',
-        'interval': '5',
+        'frames': str(frames),
+        'interval': str(RADAR_LOOP_INTERVAL),
         'filter': '0',
         'cu': '0',
         'sortcol': 'fcster',
@@ -978,9 +1490,1091 @@ def build_tropical_url(lat, lon, zip_code=None):
             url_parts.append(f"{key}={value}&")
     return ''.join(url_parts).rstrip('&')
 
-def fetch_radar_image(is_tropical=False, tropical_thread=None, tropical_results=None):
+RADAR_GIF_LINK_TEXT = b'Download as Animated Gif'
+RADAR_GIF_HREF_PATTERN = re.compile(rb'href\s*=\s*["\']?([^"\'\s>]+)', re.IGNORECASE)
+RADAR_GIF_ANCHOR_PATTERN = re.compile(rb'<a\s', re.IGNORECASE)  # Not <abbr>, <area> and friends
+
+def resolve_radar_gif_url(page_url):
+    # Returns the absolute GIF URL behind the "Download as Animated Gif" anchor on an IEM rview page, or None.
+    # Not cached: the page URL carries the loop's end time and the link is to a GIF for that time only,
+    # so the same page hardly ever gets asked for twice.
+    html_buffer = bytearray()
+    link_end = -1
+    with http_get(page_url, stream=True) as response:
+        response.raise_for_status()
+        for chunk in response.iter_content(chunk_size=8192):
+            if chunk:
+                # Only rescan the new bytes (plus enough overlap to catch the marker split across chunks)
+                search_from = max(0, len(html_buffer) - len(RADAR_GIF_LINK_TEXT))
+                html_buffer += chunk
+                link_end = html_buffer.find(RADAR_GIF_LINK_TEXT, search_from)
+                if link_end != -1:
+                    break
+    if link_end == -1:
+        print("Could not find the GIF download link on the page.")
+        return None
+
+    # The last anchor that opens before the link text is the one it belongs to
+    anchor_start = -1
+    for anchor_match in RADAR_GIF_ANCHOR_PATTERN.finditer(html_buffer, 0, link_end):
+        anchor_start = anchor_match.start()
+    href_match = RADAR_GIF_HREF_PATTERN.search(html_buffer, anchor_start, link_end) if anchor_start != -1 else None
+    if not href_match:
+        print("Could not find the GIF download link on the page.")
+        return None
+    base_site_url = "https://mesonet.agron.iastate.edu/GIS/apps/rview/"
+    # The href is still HTML, &amp; and friends have to be decoded before it's a URL
+    return urljoin(base_site_url, html.unescape(href_match.group(1).decode('utf-8', errors='ignore')))
+
+class StreamingDownload:
+    # Read-only, seekable file object over a response body that is still arriving.
+    # A feeder thread appends to the buffer and read() blocks until the bytes it wants are in,
+    # so PIL can start decoding frames while the rest of the GIF is still downloading.
+    def __init__(self, response, chunk_size=64 * 1024):
+        self.total_size = int(response.headers.get('Content-Length') or 0)
+        self._buffer = bytearray()
+        self._pos = 0
+        self._done = False
+        self._closed = False
+        self._error = None
+        self._cond = threading.Condition()
+        threading.Thread(target=self._download, args=(response, chunk_size), daemon=True).start()
+
+    def _download(self, response, chunk_size):
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if self._closed:
+                    break
+                if chunk:
+                    with self._cond:
+                        self._buffer += chunk
+                        self._cond.notify_all()
+        except Exception as e:
+            self._error = e
+        finally:
+            response.close()
+            with self._cond:
+                self._done = True
+                self._cond.notify_all()
+
+    def _wait_for(self, end):
+        # end=None waits for the whole body
+        with self._cond:
+            while not self._done and (end is None or len(self._buffer) < end):
+                self._cond.wait()
+            if self._error and (end is None or len(self._buffer) < end):
+                raise self._error
+
+    def read(self, size=-1):
+        end = None if size is None or size < 0 else self._pos + size
+        self._wait_for(end)
+        with self._cond:
+            data = bytes(self._buffer[self._pos:end])
+        self._pos += len(data)
+        return data
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            self._wait_for(None)
+            offset += len(self._buffer)
+        self._pos = max(0, offset)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def close(self):
+        # Stops the feeder early if nobody is going to decode this after all
+        self._closed = True
+
+def open_radar_gif_stream(page_url):
+    # Resolve the GIF link off an IEM rview page and start pulling the GIF itself in the background.
+    full_gif_url = resolve_radar_gif_url(page_url)
+    if not full_gif_url:
+        return None
+    gif_response = http_get(full_gif_url, stream=True, timeout=(10, 240))
     try:
-        lat, lon, _, _ = get_coordinates_from_zip(ZIP_CODE)
+        gif_response.raise_for_status()
+    except Exception:
+        gif_response.close()
+        raise
+    return StreamingDownload(gif_response)  # Closes it once the body is in (or it fails)
+
+# Radar frames are stored 8-bit against a palette shared by the whole loop (a quarter of the memory
+# of 32-bit SRCALPHA frames).
+# Keep GIF frames after the first in P mode as long as the palette doesn't change, so they can be
+# quantized straight onto the shared palette (and are a quarter the size going to the decode processes)
+GifImagePlugin.LOADING_STRATEGY = GifImagePlugin.LoadingStrategy.RGB_AFTER_DIFFERENT_PALETTE_ONLY
+
+# Per-loop tuning for the frame pipeline. The tropical GIF has a title strip on top that gets cropped off.
+RADAR_LOOP_PROFILES = {
+    'standard': {'crop_top': 0.0, 'offset_y': -75},
+    'tropical': {'crop_top': 0.1, 'offset_y': 40}
+}
+
+def get_radar_offset_y():
+    # How far up the main loop used to blit the radar; tuned against the window size, then brought
+    # down to the render size. Different scaling for at or below 720p.
+    base_offset = -75
+    base_height = 720
+    if DISPLAY_HEIGHT >= 720:
+        multiplier = 1.0 + ((DISPLAY_HEIGHT - 720) * 0.3 / 360)
+    else:
+        multiplier = 1.0 - ((720 - DISPLAY_HEIGHT) * 0.3 / 360)
+    return int(base_offset * (SCREEN_HEIGHT / base_height) * multiplier)
+
+# What rview will render, smallest first. The offsets above were tuned against the biggest one.
+RADAR_IMAGE_SIZES = [(640, 480), (800, 600), (1024, 768), (1280, 1024)]
+RADAR_REFERENCE_SIZE = (1280, 1024)
+
+def get_radar_scaled_size(source_size, crop_top=0.0):
+    # Aspect-fill the screen (the render size, so lower quality settings get smaller frames).
+    # Returns (crop_y, new_width, new_height), the size being what the cropped GIF gets scaled to.
+    source_width, source_height = source_size
+    crop_y = int(source_height * crop_top)
+    aspect_ratio = source_width / (source_height - crop_y)
+    if aspect_ratio > SCREEN_WIDTH / SCREEN_HEIGHT:
+        return crop_y, int(SCREEN_HEIGHT * aspect_ratio), SCREEN_HEIGHT
+    return crop_y, SCREEN_WIDTH, int(SCREEN_WIDTH / aspect_ratio)
+
+def get_radar_top(source_size, crop_top=0.0, offset_y=0):
+    # Where the top of the scaled picture lands on screen. Smaller GIFs aren't quite the same shape
+    # (4:3 instead of 5:4), so they get nudged to keep the middle of the map (the location) in the
+    # same spot as the 1280x1024 one.
+    _, _, reference_height = get_radar_scaled_size(RADAR_REFERENCE_SIZE, crop_top)
+    _, _, new_height = get_radar_scaled_size(source_size, crop_top)
+    top = int(offset_y * SCREEN_HEIGHT / DISPLAY_HEIGHT) + get_radar_offset_y()
+    return top + (reference_height - new_height) // 2
+
+def get_radar_image_size(profile_name='standard'):
+    # The smallest GIF that still covers the screen without being scaled up. No point pulling down
+    # and decoding 1280x1024 frames to shrink them onto a 720p (or lower quality) render size.
+    # It also has to fill the same part of the screen the 1280x1024 one would.
+    profile = RADAR_LOOP_PROFILES[profile_name]
+    _, reference_size, reference_position = get_radar_placement(RADAR_REFERENCE_SIZE, profile['crop_top'], profile['offset_y'])
+    for size in RADAR_IMAGE_SIZES:
+        crop_y, new_width, new_height = get_radar_scaled_size(size, profile['crop_top'])
+        _, visible_size, position = get_radar_placement(size, profile['crop_top'], profile['offset_y'])
+        if new_width <= size[0] and new_height <= size[1] - crop_y and (visible_size, position) == (reference_size, reference_position):
+            return size
+    return RADAR_REFERENCE_SIZE
+
+def get_radar_image_param(profile_name='standard'):
+    width, height = get_radar_image_size(profile_name)
+    return f"{width}x{height}"
+
+def get_radar_placement(source_size, crop_top=0.0, offset_y=0):
+    # Works out the crop, the aspect-fill scale to the render size and both vertical offsets (the
+    # per-loop one, in window pixels, and the main loop's) in one go. Returns (box, size, position):
+    # resizing box out of the GIF frame to size gives exactly the part that ends up on screen, to be
+    # blitted at position. Nothing off screen gets scaled or stored.
+    source_width, source_height = source_size
+    crop_y, new_width, new_height = get_radar_scaled_size(source_size, crop_top)
+    scale_x = new_width / source_width
+    scale_y = new_height / (source_height - crop_y)
+
+    # Where the top of the scaled picture lands on screen, and the slice of it that's visible
+    top = get_radar_top(source_size, crop_top, offset_y)
+    visible_top = max(0, top)
+    visible_bottom = max(visible_top + 1, min(SCREEN_HEIGHT, top + new_height))
+    visible_width = min(SCREEN_WIDTH, new_width)
+    box = (0, crop_y + (visible_top - top) / scale_y, visible_width / scale_x, crop_y + (visible_bottom - top) / scale_y)
+    return box, (visible_width, visible_bottom - visible_top), (0, visible_top)
+
+# Radar frame pipeline stages. PIL stages take and return a PIL image, surface stages a pygame
+# Surface. They only get plain arguments (no globals) so the same stage works anywhere.
+def place_radar_frame(image, size, box):
+    # Crop, scale and offset in a single resize, see get_radar_placement
+    return image.convert('RGB').resize(size, Image.Resampling.LANCZOS, box=box)
+
+def crop_radar_frame(image, box):
+    # For when the GIF is already at the render size, nothing to resample. Indexed frames stay indexed.
+    frame = image.crop(box)
+    return frame if frame.mode == 'P' else frame.convert('RGB')
+
+def quantize_radar_frame(image, palette):
+    # Down to 8 bits against the loop's shared palette. No dithering, radar colours are flat bands
+    # and dither noise would just flicker from frame to frame.
+    if image.mode == 'P' and (image.getpalette() + [0] * 768)[:768] == palette:
+        # Only frames on the first frame's palette stay in P mode, see LOADING_STRATEGY. When a roll
+        # passes in the ring's palette that can still be a different one, so those get redone below.
+        return image
+    palette_image = Image.new('P', (1, 1))
+    palette_image.putpalette(palette)
+    return image.convert('RGB').quantize(palette=palette_image, dither=Image.Dither.NONE)
+
+def get_radar_frame_palette(surface):
+    # An 8-bit frame's palette laid out like get_radar_palette's, None for 32-bit frames
+    if surface.get_bytesize() != 1:
+        return None
+    return [channel for color in surface.get_palette() for channel in color[:3]]
+
+def match_radar_frame(surface, reference):
+    # Every GIF comes with its own palette, so a frame from one GIF that has to sit in a loop decoded
+    # from another gets redone on the reference frame's palette (or made 32-bit if that one is).
+    # The diffs compare palette indices, so without this an unchanged pixel could count as changed.
+    palette = get_radar_frame_palette(reference)
+    if surface.get_bytesize() == reference.get_bytesize() and get_radar_frame_palette(surface) == palette:
+        return surface
+    raw_format = 'P' if surface.get_bytesize() == 1 else 'RGB'
+    image = Image.frombytes(raw_format, surface.get_size(), pygame.image.tobytes(surface, raw_format))
+    if raw_format == 'P':
+        image.putpalette(get_radar_frame_palette(surface))
+    image = quantize_radar_frame(image, palette) if palette else image.convert('RGB')
+    return convert_radar_frame(*pack_radar_image(image))
+
+def convert_radar_frame(mode, size, data, palette=None):
+    # The PIL -> pygame hop between the two halves of the pipeline, takes a raw buffer.
+    # Indexed frames stay 8-bit, SDL expands them through the palette when they're blitted.
+    # The Surface is made straight over data (no copy), fine as radar frames never get drawn on.
+    surface = pygame.image.frombuffer(data, size, mode)
+    if mode == 'P':
+        surface.set_palette([tuple(palette[i:i + 3]) for i in range(0, len(palette), 3)])
+        return surface
+    return surface.convert()
+
+class RadarFramePipeline:
+    # GIF frame in, display-ready Surface out: PIL stages, the convert step, then surface stages.
+    # Anything that should apply to every radar/tropical frame gets added here as a stage.
+    # position is where the finished frames go on screen.
+    def __init__(self, pil_stages, surface_stages, convert=convert_radar_frame, position=(0, 0)):
+        self.pil_stages = list(pil_stages)
+        self.surface_stages = list(surface_stages)
+        self.convert = convert
+        self.position = position
+
+    def run_pil_stages(self, image):
+        for stage in self.pil_stages:
+            image = stage(image)
+        return image
+
+    def run_surface_stages(self, surface):
+        for stage in self.surface_stages:
+            surface = stage(surface)
+        return surface
+
+    def process(self, frame):
+        image = self.run_pil_stages(frame)
+        return self.run_surface_stages(self.convert(*pack_radar_image(image)))
+
+# The PIL stages are the CPU heavy part (RGBA convert + one or two LANCZOS resizes per frame),
+# so they can be farmed out to worker processes; frames go over as raw buffers and come back as
+# raw buffers, only the pygame convert and surface stages stay on this side.
+# The workers are spawned, so each one imports all of mini8s again (~70 MB each); they're only kept
+# around while a full loop decodes. The few frames a refresh rolls in are decoded in-process.
+RADAR_DECODE_PROCESSES = max(1, min(6, (os.cpu_count() or 1) - 1))  # Leave a core for the render loop
+
+_decode_pool = None
+_decode_pool_failed = False
+_decode_pool_users = 0
+_decode_pool_lock = threading.Lock()
+
+def get_decode_pool():
+    # Returns the shared process pool, or None if we're decoding in-process (one core, or the pool broke).
+    # Every call that gets a pool has to hand it back with release_decode_pool() once its frames are in.
+    global _decode_pool, _decode_pool_failed, _decode_pool_users
+    with _decode_pool_lock:
+        if _decode_pool is None and not _decode_pool_failed and RADAR_DECODE_PROCESSES > 1:
+            try:
+                # spawn everywhere, forking a process with SDL and a bunch of threads running is asking for trouble
+                _decode_pool = ProcessPoolExecutor(max_workers=RADAR_DECODE_PROCESSES, mp_context=multiprocessing.get_context('spawn'))
+            except Exception as e:
+                print(f"Could not start the radar decode processes, decoding in-process: {e}")
+                _decode_pool_failed = True
+        if _decode_pool:
+            _decode_pool_users += 1
+        return _decode_pool
+
+def release_decode_pool():
+    # Shuts the workers down (and gives their memory back) once nobody is decoding with them anymore
+    global _decode_pool, _decode_pool_users
+    with _decode_pool_lock:
+        _decode_pool_users = max(0, _decode_pool_users - 1)
+        if _decode_pool and not _decode_pool_users:
+            _decode_pool.shutdown(wait=True)
+            _decode_pool = None
+
+def disable_decode_pool(error):
+    global _decode_pool, _decode_pool_failed
+    print(f"Radar decode processes failed ({error}), decoding in-process from now on")
+    with _decode_pool_lock:
+        if _decode_pool:
+            _decode_pool.shutdown(wait=False, cancel_futures=True)
+        _decode_pool = None
+        _decode_pool_failed = True
+
+def pack_radar_frame(frame):
+    # Just enough to rebuild the frame on the other side, palette and transparency included
+    return (frame.mode, frame.size, frame.tobytes(), frame.getpalette() if frame.mode == 'P' else None, frame.info.get('transparency'))
+
+def run_radar_pil_stages(pil_stages, packed_frame):
+    # Runs in a decode worker process
+    mode, size, data, palette, transparency = packed_frame
+    image = Image.frombytes(mode, size, data)
+    if palette:
+        image.putpalette(palette)
+    if transparency is not None:
+        image.info['transparency'] = transparency
+    for stage in pil_stages:
+        image = stage(image)
+    return pack_radar_image(image)
+
+def pack_radar_image(image):
+    # What convert_radar_frame needs, the palette only matters for indexed frames
+    return image.mode, image.size, image.tobytes(), image.getpalette() if image.mode == 'P' else None
+
+def get_radar_palette(pil_gif):
+    # The loop's shared palette: the GIF's own (rview writes one global palette for the whole loop),
+    # None if it doesn't have one and the frames have to stay 32-bit
+    if pil_gif.mode != 'P' or not pil_gif.getpalette():
+        return None
+    return (pil_gif.getpalette() + [0] * 768)[:768]
+
+def get_radar_pipeline(source_size, is_tropical=False, palette=None):
+    # source_size is the GIF's, palette=None keeps the frames 32-bit
+    profile = RADAR_LOOP_PROFILES['tropical' if is_tropical else 'standard']
+    box, size, position = get_radar_placement(source_size, crop_top=profile['crop_top'], offset_y=profile['offset_y'])
+    if all(float(edge).is_integer() for edge in box) and (box[2] - box[0], box[3] - box[1]) == size:
+        # 1:1 with the render size, so it's just a crop
+        pil_stages = [functools.partial(crop_radar_frame, box=tuple(int(edge) for edge in box))]
+    else:
+        pil_stages = [functools.partial(place_radar_frame, size=size, box=box)]
+    if palette:
+        pil_stages.append(functools.partial(quantize_radar_frame, palette=palette))
+    return RadarFramePipeline(pil_stages=pil_stages, surface_stages=[], position=position)
+
+def decode_radar_gif(gif_file_stream, is_tropical=False, progress_callback=None, pooled=True, palette=None):
+    # gif_file_stream is anything file-like, usually a StreamingDownload that is still filling up.
+    # progress_callback(frames) gets called with the frames so far after each one is ready.
+    # palette is the one to quantize onto instead of the GIF's own, for frames joining an existing loop.
+    # Returns (frames, durations, position), position being where the frames go on screen.
+    pil_gif = Image.open(gif_file_stream)
+    pipeline = get_radar_pipeline(pil_gif.size, is_tropical, palette=palette or get_radar_palette(pil_gif))
+    pool = get_decode_pool() if pooled else None
+    if pool:
+        try:
+            return decode_radar_gif_pooled(pil_gif, pipeline, pool, progress_callback) + (pipeline.position,)
+        except (BrokenProcessPool, pickle.PicklingError, OSError) as e:
+            disable_decode_pool(e)
+            gif_file_stream.seek(0)
+            pil_gif = Image.open(gif_file_stream)
+        finally:
+            release_decode_pool()
+
+    pygame_frames = []
+    frame_durations_ms = []
+    for frame in ImageSequence.Iterator(pil_gif):
+        pygame_frames.append(pipeline.process(frame))
+        frame_durations_ms.append(get_frame_duration(frame))
+        if progress_callback:
+            progress_callback(pygame_frames)
+    return pygame_frames, frame_durations_ms, pipeline.position
+
+def get_frame_duration(frame):
+    duration = frame.info.get('duration', 100)
+    if not isinstance(duration, (int, float)) or duration <= 0:
+        duration = 100
+    return int(duration)
+
+def decode_radar_gif_pooled(pil_gif, pipeline, pool, progress_callback=None):
+    # GIF frames have to be composited in order, so that part stays here; each composited frame is
+    # shipped off for its PIL stages and converted to a Surface once it comes back, in order.
+    pygame_frames = []
+    frame_durations_ms = []
+    pending = collections.deque()
+    max_in_flight = RADAR_DECODE_PROCESSES * 2  # Don't let raw frames pile up if decoding outruns the workers
+
+    def finish_oldest():
+        future, duration = pending.popleft()
+        pygame_frames.append(pipeline.run_surface_stages(pipeline.convert(*future.result())))
+        frame_durations_ms.append(duration)
+        if progress_callback:
+            progress_callback(pygame_frames)
+
+    for frame in ImageSequence.Iterator(pil_gif):
+        pending.append((pool.submit(run_radar_pil_stages, pipeline.pil_stages, pack_radar_frame(frame)), get_frame_duration(frame)))
+        while pending and (len(pending) >= max_in_flight or pending[0][0].done()):
+            finish_oldest()
+    while pending:
+        finish_oldest()
+    return pygame_frames, frame_durations_ms
+
+# Decoded loops are kept as deltas: the first frame in full, then for every frame only the tiles that
+# changed since the frame before (plus a wrap patch from the last frame back to the first). The map
+# underneath never moves, so that's mostly just the echoes, and the main loop only has to redraw those.
+RADAR_DIFF_TILE = 32  # Pixels. Changed tiles next to each other in a row are merged into one patch
+RADAR_MAX_DIRTY_RECTS = 24  # Past this many the main loop redraws their bounding box instead
+
+def find_changed_radar_tiles(previous, current, tile_size=RADAR_DIFF_TILE):
+    # Returns a row of booleans (one per tile column) for every band of tiles, True where they differ.
+    # With numpy the pixels are compared in place through views of both Surfaces.
+    if numpy is not None and current.get_bytesize() in (1, 4) and previous.get_bytesize() == current.get_bytesize():
+        width, height = current.get_size()
+        # Transposed back to rows x columns, which is how the pixels sit in memory
+        before = pygame.surfarray.pixels2d(previous).T
+        after = pygame.surfarray.pixels2d(current).T
+        changed = before != after
+        del before, after  # Unlocks the Surfaces again
+        # Fold every band of rows, then every run of columns, down to one "anything changed" flag per tile
+        changed = numpy.logical_or.reduceat(changed, numpy.arange(0, height, tile_size), axis=0)
+        return numpy.logical_or.reduceat(changed, numpy.arange(0, width, tile_size), axis=1).tolist()
+
+    width, height = current.get_size()
+    raw_format = 'P' if current.get_bytesize() == 1 else 'RGBA'
+    bytes_per_pixel = len(raw_format)
+    before = pygame.image.tobytes(previous, raw_format)
+    after = pygame.image.tobytes(current, raw_format)
+    stride = width * bytes_per_pixel
+    tile_bytes = tile_size * bytes_per_pixel
+    tile_columns = (width + tile_size - 1) // tile_size
+
+    bands = []
+    for band_top in range(0, height, tile_size):
+        band_height = min(tile_size, height - band_top)
+        changed = [False] * tile_columns
+        for y in range(band_top, band_top + band_height):
+            row = y * stride
+            if before[row:row + stride] == after[row:row + stride]:
+                continue
+            for column in range(tile_columns):
+                if not changed[column]:
+                    start = row + column * tile_bytes
+                    end = min(start + tile_bytes, row + stride)
+                    changed[column] = before[start:end] != after[start:end]
+        bands.append(changed)
+    return bands
+
+def diff_radar_frames(previous, current, tile_size=RADAR_DIFF_TILE):
+    # Returns [(rect, patch)] that turn previous into current, both same-size radar frames
+    width, height = current.get_size()
+    tile_columns = (width + tile_size - 1) // tile_size
+
+    patches = []
+    for band_index, changed in enumerate(find_changed_radar_tiles(previous, current, tile_size)):
+        band_top = band_index * tile_size
+        band_height = min(tile_size, height - band_top)
+        column = 0
+        while column < tile_columns:
+            if not changed[column]:
+                column += 1
+                continue
+            run_start = column
+            while column < tile_columns and changed[column]:
+                column += 1
+            rect = pygame.Rect(run_start * tile_size, band_top, min(column * tile_size, width) - run_start * tile_size, band_height)
+            patches.append((rect, current.subsurface(rect).copy()))
+    return patches
+
+def apply_radar_patches(canvas, patches):
+    # Frames are opaque, so a plain blit overwrites
+    for rect, patch in patches:
+        canvas.blit(patch, rect)
+
+# RADAR_MEMORY_BUDGET_MB covers everything the loops hold (all loops together): keyframes and last
+# frames, which always stay as Surfaces, the compressed data and the inflated-patch LRU are counted
+# first, and patches are kept as Surfaces in whatever is left. Anything past that is kept zlib
+# compressed and inflated a few frames ahead of playback by a background thread.
+RADAR_PREFETCH_FRAMES = 4
+RADAR_INFLATED_CACHE_FRAMES = 8  # LRU of inflated patch sets
+
+class RadarPatchSet:
+    # The patches for one frame step, either as they are or compressed. Read them through get().
+    def __init__(self, patches):
+        self.size = sum(patch.get_width() * patch.get_height() * patch.get_bytesize() for _, patch in patches)
+        self.patches = patches
+        self.compressed = None
+        if radar_frame_store.reserve(self.size):
+            weakref.finalize(self, radar_frame_store.release, self.size)
+        elif patches:
+            self.compress()
+
+    @classmethod
+    def from_compressed(cls, raw_format, palette, rects, data):
+        # A set that's compressed already (straight off the disk cache), it stays that way
+        patch_set = cls([])
+        patch_set.size = sum(rect.width * rect.height for rect in rects) * (1 if raw_format == 'P' else 4)
+        patch_set.patches = None
+        patch_set.compressed = (raw_format, palette, rects, data)
+        radar_frame_store.hold(patch_set, len(data))
+        return patch_set
+
+    def get_rects(self):
+        # Where the patches go, without inflating anything
+        return self.compressed[2] if self.compressed else [rect for rect, _ in self.patches]
+
+    def compress(self):
+        patches = self.patches
+        raw_format = 'P' if patches[0][1].get_bytesize() == 1 else 'RGB'
+        palette = patches[0][1].get_palette() if raw_format == 'P' else None
+        data = b''.join(pygame.image.tobytes(patch, raw_format) for _, patch in patches)
+        self.compressed = (raw_format, palette, [rect for rect, _ in patches], zlib.compress(data, 1))
+        self.patches = None
+        radar_frame_store.hold(self, len(self.compressed[3]))
+
+    def inflate(self):
+        raw_format, palette, rects, data = self.compressed
+        data = zlib.decompress(data)
+        bytes_per_pixel = len(raw_format)
+        patches = []
+        offset = 0
+        for rect in rects:
+            length = rect.width * rect.height * bytes_per_pixel
+            patch = pygame.image.frombytes(data[offset:offset + length], rect.size, raw_format)
+            if palette:
+                patch.set_palette(palette)
+            patches.append((rect, patch))
+            offset += length
+        return patches
+
+    def get(self):
+        if self.patches is not None:
+            return self.patches
+        return radar_frame_store.get_inflated(self)
+
+class RadarFrameStore:
+    # Budget bookkeeping plus the inflated-patch LRU and the thread that fills it
+    def __init__(self):
+        self.used = 0
+        self.lock = threading.Lock()
+        self.held_frames = weakref.WeakSet()  # Keyframes/last frames already counted, loops rolled off each other share them
+        self.inflated = collections.OrderedDict()
+        self.prefetch_queue = queue.Queue()
+        self.prefetch_thread = None
+
+    def reserve(self, size, force=False):
+        # force counts it even past the budget, for what has to be held either way
+        with self.lock:
+            if not force and self.used + size > RADAR_MEMORY_BUDGET_MB * 1024 * 1024:
+                return False
+            self.used += size
+            return True
+
+    def release(self, size):
+        with self.lock:
+            self.used -= size
+
+    def hold(self, owner, size):
+        # Counts size against the budget for as long as owner is around
+        self.reserve(size, force=True)
+        weakref.finalize(owner, self.release, size)
+
+    def hold_frames(self, frames):
+        # Full frames a loop keeps, each one counted once however many loops share it
+        for frame in frames:
+            with self.lock:
+                if frame in self.held_frames:
+                    continue
+                self.held_frames.add(frame)
+            self.hold(frame, frame.get_width() * frame.get_height() * frame.get_bytesize())
+
+    def get_inflated(self, patch_set):
+        with self.lock:
+            patches = self.inflated.get(patch_set)
+            if patches is not None:
+                self.inflated.move_to_end(patch_set)
+                return patches
+        # Not prefetched in time (or a jump), inflate it here
+        patches = patch_set.inflate()
+        with self.lock:
+            if patch_set not in self.inflated:
+                self.used += patch_set.size
+            self.inflated[patch_set] = patches
+            while len(self.inflated) > RADAR_INFLATED_CACHE_FRAMES:
+                evicted, _ = self.inflated.popitem(last=False)
+                self.used -= evicted.size
+        return patches
+
+    def prefetch(self, patch_sets):
+        patch_sets = [patch_set for patch_set in patch_sets if patch_set.compressed]
+        if not patch_sets:
+            return
+        if self.prefetch_thread is None:
+            self.prefetch_thread = threading.Thread(target=self.run_prefetch, daemon=True)
+            self.prefetch_thread.start()
+        for patch_set in patch_sets:
+            self.prefetch_queue.put(patch_set)
+
+    def run_prefetch(self):
+        while True:
+            patch_set = self.prefetch_queue.get()
+            with self.lock:
+                cached = patch_set in self.inflated
+            if not cached:
+                self.get_inflated(patch_set)
+
+radar_frame_store = RadarFrameStore()
+
+class RadarLoop:
+    # One decoded loop as a keyframe + patches. Never changed once built (the main thread may be
+    # playing it while a refresh rolls a new one off it), so frames handed out must not be drawn on.
+    # position is where the frames get blitted on screen.
+    def __init__(self, keyframe, last_frame, patches, wrap_patch, position=(0, 0)):
+        self.keyframe = keyframe
+        self.last_frame = last_frame
+        self.patches = patches  # RadarPatchSets, patches[i] turns frame i-1 into frame i, patches[0] is empty
+        self.wrap_patch = wrap_patch
+        self.position = position
+        radar_frame_store.hold_frames((keyframe, last_frame))
+
+    @classmethod
+    def from_frames(cls, frames, position=(0, 0)):
+        # The full frames count first, the patches get what's left of the budget
+        radar_frame_store.hold_frames((frames[0], frames[-1]))
+        patches = [RadarPatchSet([])] + [RadarPatchSet(diff_radar_frames(previous, current)) for previous, current in zip(frames, frames[1:])]
+        return cls(frames[0], frames[-1], patches, RadarPatchSet(diff_radar_frames(frames[-1], frames[0])), position)
+
+    def __len__(self):
+        return len(self.patches)
+
+    def __getitem__(self, index):
+        # Full frame rebuilt from the keyframe, fine for the odd lookup; playback goes through advance()
+        index = range(len(self))[index]
+        if index == 0:
+            return self.keyframe
+        if index == len(self) - 1:
+            return self.last_frame
+        frame = self.keyframe.copy()
+        for patch_set in self.patches[1:index + 1]:
+            apply_radar_patches(frame, patch_set.get())
+        return frame
+
+    def advance(self, canvas, index):
+        # canvas holds frame index-1 (the last frame when index is 0), patch it up to frame index.
+        # Returns the rects that changed.
+        patches = (self.patches[index] if index else self.wrap_patch).get()
+        apply_radar_patches(canvas, patches)
+        upcoming = [(index + ahead) % len(self) for ahead in range(1, RADAR_PREFETCH_FRAMES + 1)]
+        radar_frame_store.prefetch([self.patches[i] if i else self.wrap_patch for i in upcoming])
+        return [rect for rect, _ in patches]
+
+    def roll(self, frames, max_frames, replace_last=False):
+        # New loop with frames added on the end and as many dropped off the front as it takes to
+        # stay at max_frames. Only the seams need diffing, the patches in between carry over.
+        # replace_last drops our last frame first, frames[0] is a new copy of it.
+        kept = len(self) - 1 if replace_last else len(self)
+        drop = kept + len(frames) - max_frames
+        if kept == 0 or drop >= kept:
+            return RadarLoop.from_frames(frames[-max_frames:], self.position)
+        drop = max(0, drop)
+        # Normally already on our palette (see apply_radar_loop_update), then this is a no-op
+        frames = [match_radar_frame(frame, self.last_frame) for frame in frames]
+        keyframe = self[drop]
+        last_kept = self[kept - 1]
+        radar_frame_store.hold_frames((keyframe, frames[-1]))
+        patches = ([RadarPatchSet([])] + self.patches[drop + 1:kept] + [RadarPatchSet(diff_radar_frames(last_kept, frames[0]))]
+                   + [RadarPatchSet(diff_radar_frames(previous, current)) for previous, current in zip(frames, frames[1:])])
+        return RadarLoop(keyframe, frames[-1], patches, RadarPatchSet(diff_radar_frames(frames[-1], keyframe)), self.position)
+
+class RadarPlayback:
+    # Main thread side: one canvas that gets patched forward a frame at a time
+    def __init__(self):
+        self.loop = None
+        self.index = None
+        self.canvas = None
+
+    def show(self, loop, index):
+        # Returns the rects on the canvas that changed, or None if it's a different picture altogether
+        if loop is self.loop and index == self.index:
+            return []
+        if loop is self.loop and index == (self.index + 1) % len(loop):
+            self.index = index
+            return loop.advance(self.canvas, index)
+        self.loop, self.index = loop, index
+        self.canvas = loop[index].copy()
+        return None
+
+# Rolling radar loops. Each loop ("radar", "tropical") keeps its decoded frames for the last
+# RADAR_LOOP_FRAMES timestamps; a refresh only asks rview for the timestamps that are new since
+# last time (frames=k ending at the current slot) and drops the same number off the old end.
+# The newest frame held is provisional: IEM's composite for the current slot can lag a few minutes
+# behind, so that slot gets fetched again with the next refresh and its frame replaced.
+# Both get picked at startup by configure_radar_loop.
+RADAR_LOOP_FRAMES = 49
+RADAR_LOOP_INTERVAL = 5  # Minutes between frames
+RADAR_LOOP_KEY_TIME = datetime(2000, 1, 1)  # Fixed time so a loop's URL can double as its cache key
+
+# Loop length policy, overridden per key by the "radar_loop" section of config.json. frames and
+# interval are numbers or "auto"; auto fits the loop to what the last full loop download cost on this
+# machine (RADAR_LOOP_STATS_PATH) and the memory budget, then spreads those frames over span_minutes.
+RADAR_LOOP_POLICY = {
+    'frames': 'auto',
+    'interval': 'auto',
+    'min_frames': 16,
+    'max_frames': 73,
+    'span_minutes': 240,  # How far back an auto interval reaches
+    'load_seconds': 60,  # Download + decode time a full loop may take
+    'memory_share': 0.5  # Of RADAR_MEMORY_BUDGET_MB, per loop (radar and tropical)
+}
+RADAR_LOOP_REFERENCE_FRAMES = 49  # What SPEED_FACTOR was tuned against
+RADAR_LOOP_STATS_PATH = os.path.join(CACHE_DIR, "radar_loop_stats.json")
+
+def get_radar_loop_pace():
+    # Playback time per frame relative to a 49 frame loop, so shorter loops don't whizz by and
+    # longer ones don't drag; the loop takes about the same time to play whatever its length.
+    return RADAR_LOOP_REFERENCE_FRAMES / RADAR_LOOP_FRAMES
+
+def record_radar_loop_stats(loop_name, seconds, loop):
+    # What a full loop cost, per frame: seconds from asking rview for it to the last frame decoded,
+    # and bytes held per render pixel (so it still holds after a resolution/quality change).
+    # Blended with the last runs so one slow download doesn't shrink the loop for good.
+    keyframe = loop.keyframe
+    frame_bytes = keyframe.get_width() * keyframe.get_height() * keyframe.get_bytesize()
+    loop_bytes = 2 * frame_bytes + sum(patch_set.size for patch_set in loop.patches) + loop.wrap_patch.size
+    measured = {'seconds_per_frame': seconds / len(loop),
+                'bytes_per_pixel': loop_bytes / len(loop) / (SCREEN_WIDTH * SCREEN_HEIGHT)}
+    stats = load_json_cache(RADAR_LOOP_STATS_PATH)
+    previous = stats.get(loop_name) or measured
+    stats[loop_name] = {name: round((previous.get(name, value) + value) / 2, 6) for name, value in measured.items()}
+    save_json_cache(RADAR_LOOP_STATS_PATH, stats)
+
+def choose_radar_loop(policy, stats):
+    # Returns (frames, interval) for a policy (RADAR_LOOP_POLICY plus overrides) and the recorded stats
+    frames = policy['frames']
+    if frames == 'auto':
+        frames = RADAR_LOOP_REFERENCE_FRAMES
+        if stats:
+            # The slowest loop decides, both have to load in time
+            seconds_per_frame = max(loop_stats.get('seconds_per_frame', 0) for loop_stats in stats.values())
+            bytes_per_frame = max(loop_stats.get('bytes_per_pixel', 0) for loop_stats in stats.values()) * SCREEN_WIDTH * SCREEN_HEIGHT
+            if seconds_per_frame > 0:
+                frames = int(policy['load_seconds'] / seconds_per_frame)
+            if bytes_per_frame > 0:
+                frames = min(frames, int(RADAR_MEMORY_BUDGET_MB * 1024 * 1024 * policy['memory_share'] / bytes_per_frame))
+        frames = max(policy['min_frames'], min(policy['max_frames'], frames))
+    frames = max(1, int(frames))
+
+    interval = policy['interval']
+    if interval == 'auto':
+        # rview's composites are 5 minutes apart, so go by 5s. Once a loop has enough frames to
+        # cover span_minutes at 5 minutes it just reaches further back.
+        interval = 5 * round(policy['span_minutes'] / max(1, frames - 1) / 5)
+    return frames, max(5, int(interval))
+
+def configure_radar_memory_budget(value):
+    # Sets RADAR_MEMORY_BUDGET_MB from "radar_memory_budget_mb" in config.json, megabytes and more than 0
+    global RADAR_MEMORY_BUDGET_MB
+    try:
+        if isinstance(value, bool):
+            raise TypeError("not a number")
+        budget = float(value)
+        if not math.isfinite(budget) or budget <= 0:
+            raise ValueError("has to be more than 0")
+    except (TypeError, ValueError) as e:
+        print(f"Warning: Bad radar_memory_budget_mb in config.json ({value!r}: {e}), using {RADAR_MEMORY_BUDGET_MB} MB")
+        return
+    RADAR_MEMORY_BUDGET_MB = int(budget) if budget.is_integer() else budget
+
+def configure_radar_loop(config_section=None):
+    # Sets RADAR_LOOP_FRAMES/RADAR_LOOP_INTERVAL from the "radar_loop" config.json section
+    global RADAR_LOOP_FRAMES, RADAR_LOOP_INTERVAL
+    policy = dict(RADAR_LOOP_POLICY)
+    if isinstance(config_section, dict):
+        policy.update({name: value for name, value in config_section.items() if name in policy})
+    elif config_section is not None:
+        print(f"Warning: Ignoring radar_loop in config.json, expected an object: {config_section!r}")
+    try:
+        RADAR_LOOP_FRAMES, RADAR_LOOP_INTERVAL = choose_radar_loop(policy, load_json_cache(RADAR_LOOP_STATS_PATH))
+    except (TypeError, ValueError) as e:
+        print(f"Warning: Bad radar_loop settings in config.json ({e}), using the defaults")
+        RADAR_LOOP_FRAMES, RADAR_LOOP_INTERVAL = choose_radar_loop(RADAR_LOOP_POLICY, load_json_cache(RADAR_LOOP_STATS_PATH))
+    print(f"Radar loop: {RADAR_LOOP_FRAMES} frames, {RADAR_LOOP_INTERVAL} minutes apart")
+
+_radar_loops = {}
+_radar_loops_lock = threading.Lock()
+
+def align_radar_time(now=None):
+    now = now or datetime.now()
+    return now.replace(minute=now.minute - now.minute % RADAR_LOOP_INTERVAL, second=0, microsecond=0)
+
+def get_radar_loop_key(build_url):
+    # Anything that changes the picture (location, layers, zoom, screen size, quality) changes the key.
+    return (build_url(RADAR_LOOP_FRAMES, RADAR_LOOP_KEY_TIME), SCREEN_WIDTH, SCREEN_HEIGHT, DISPLAY_HEIGHT)
+
+def fetch_radar_loop_update(loop_name, build_url):
+    # Download half of a loop refresh: work out which timestamps we're missing and grab only those.
+    # build_url(frames, end_time) returns the rview page URL for that slice of the loop.
+    started = time.monotonic()
+    end_time = align_radar_time()
+    loop_key = get_radar_loop_key(build_url)
+    with _radar_loops_lock:
+        ring = _radar_loops.get(loop_name)
+    new_frames = RADAR_LOOP_FRAMES
+    replace_last = False
+    if ring and ring['key'] == loop_key:
+        steps = int((end_time - ring['end_time']).total_seconds() // (RADAR_LOOP_INTERVAL * 60))
+        if 0 <= steps < RADAR_LOOP_FRAMES - 1:
+            # The new slots plus the one our newest (provisional) frame came from
+            new_frames = steps + 1
+            replace_last = True
+            print(f"Radar loop '{loop_name}': fetching {steps} new frame(s) and the newest one again")
+    gif_stream = open_radar_gif_stream(build_url(new_frames, end_time))
+    return {'loop_name': loop_name, 'key': loop_key, 'end_time': end_time, 'new_frames': new_frames,
+            'replace_last': replace_last, 'gif_stream': gif_stream, 'build_url': build_url, 'started': started}
+
+def apply_radar_loop_update(update, is_tropical=False, progress_callback=None):
+    # Decode half: roll the new frames in, returns (RadarLoop, durations) or (None, None).
+    # progress_callback(frames_done, frames_total, frames) is passed through to the decoder.
+    with _radar_loops_lock:
+        ring = _radar_loops.get(update['loop_name'])
+    new_frames = update['new_frames']
+    rolling = update['replace_last']
+    if rolling and (not ring or ring['key'] != update['key'] or ring['is_tropical'] != is_tropical):
+        # What we hold was cropped/offset for the other mode (or got replaced meanwhile), start over
+        new_frames = RADAR_LOOP_FRAMES
+        rolling = False
+        if update['gif_stream']:
+            update['gif_stream'].close()
+        update['gif_stream'] = open_radar_gif_stream(update['build_url'](new_frames, update['end_time']))
+
+    if not update['gif_stream']:
+        return None, None
+    frames_total = new_frames
+    # Rolled in frames go straight onto the palette the ring's frames already use
+    palette = get_radar_frame_palette(ring['loop'].keyframe) if rolling else None
+    # Spinning the decode processes up again isn't worth it for the few frames of a roll
+    frames, durations, position = decode_radar_gif(update['gif_stream'], is_tropical=is_tropical, palette=palette, pooled=not rolling,
+                                         progress_callback=(lambda frames: progress_callback(len(frames), frames_total, frames)) if progress_callback else None)
+    if not frames:
+        return None, None
+    if rolling:
+        # frames[0] is the final version of our newest frame, it takes that one's place
+        loop = ring['loop'].roll(frames, RADAR_LOOP_FRAMES, replace_last=True)
+        durations = (ring['durations'][:-1] + durations)[-RADAR_LOOP_FRAMES:]
+    else:
+        loop = RadarLoop.from_frames(frames, position)
+        if len(frames) == RADAR_LOOP_FRAMES:
+            record_radar_loop_stats(update['loop_name'], time.monotonic() - update['started'], loop)
+    ring = {'key': update['key'], 'end_time': update['end_time'], 'is_tropical': is_tropical,
+            'loop': loop, 'durations': durations}
+    with _radar_loops_lock:
+        _radar_loops[update['loop_name']] = ring
+    save_radar_loop_cache(update['loop_name'], ring)
+
+    return get_radar_loop_frames(ring)
+
+def get_radar_loop_frames(ring):
+    # The loop itself is never changed, a roll builds a new one, so the main thread can keep playing it
+    frame_durations_ms = list(ring['durations'])
+    # 1.5/1500ms sec on last frame.
+    frame_durations_ms[-1] += 1500
+    return ring['loop'], frame_durations_ms
+
+# Decoded loops also go to disk (a JSON header line, then raw pixels, or the zlib data of patches held
+# compressed) so the next launch can show them straight out of a memory map while the fresh one
+# downloads. One file per loop name, key (location, layers, screen size) and end time; only the
+# newest one for a loop name is kept.
+RADAR_CACHE_DIR = os.path.join(CACHE_DIR, "radar")
+RADAR_CACHE_MAX_AGE = 30 * 60  # Seconds since the loop's last frame it's still worth showing at startup
+RADAR_CACHE_SAVE_INTERVAL = 15 * 60  # How far (in loop time) the disk copy may fall behind before it's rewritten
+_radar_cache_saved = {}  # loop name -> (key, end_time) of the copy on disk
+
+def get_radar_cache_prefix(loop_name, loop_key):
+    return f"{loop_name}_{hashlib.sha1(repr(loop_key).encode()).hexdigest()[:16]}_"
+
+def save_radar_loop_cache(loop_name, ring):
+    # Every refresh rolls the loop, but the copy on disk only has to be recent enough for a restart
+    # to pick up from, so it gets rewritten every RADAR_CACHE_SAVE_INTERVAL instead (SD cards wear out).
+    saved = _radar_cache_saved.get(loop_name)
+    if saved and saved[0] == ring['key'] and (ring['end_time'] - saved[1]).total_seconds() < RADAR_CACHE_SAVE_INTERVAL:
+        return
+    loop = ring['loop']
+    raw_format = 'P' if loop.keyframe.get_bytesize() == 1 else 'RGB'
+    # Compressed sets go in as they are, nothing gets inflated for this
+    patch_sets = loop.patches + [loop.wrap_patch]
+    header = {
+        'key': repr(ring['key']),
+        'end_time': ring['end_time'].isoformat(),
+        'is_tropical': ring['is_tropical'],
+        'durations': ring['durations'],
+        'position': list(loop.position),
+        'format': raw_format,
+        'palette': [list(color)[:3] for color in loop.keyframe.get_palette()] if raw_format == 'P' else None,
+        'frame_size': list(loop.keyframe.get_size()),
+        'patches': [[list(rect) for rect in patch_set.get_rects()] for patch_set in patch_sets],
+        # Length of each set's zlib data, None for sets stored as raw pixels
+        'compressed': [len(patch_set.compressed[3]) if patch_set.compressed else None for patch_set in patch_sets]
+    }
+    file_name = get_radar_cache_prefix(loop_name, ring['key']) + ring['end_time'].strftime("%Y%m%d%H%M") + ".bin"
+    path = os.path.join(RADAR_CACHE_DIR, file_name)
+    try:
+        os.makedirs(RADAR_CACHE_DIR, exist_ok=True)
+        temp_path = path + ".tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(json.dumps(header).encode() + b'\n')
+            f.write(pygame.image.tobytes(loop.keyframe, raw_format))
+            f.write(pygame.image.tobytes(loop.last_frame, raw_format))
+            for patch_set in patch_sets:
+                if patch_set.compressed:
+                    f.write(patch_set.compressed[3])
+                    continue
+                for _, patch in patch_set.patches:
+                    f.write(pygame.image.tobytes(patch, raw_format))
+        os.replace(temp_path, path)
+    except Exception as e:
+        print(f"Warning: Could not save radar cache {path}: {e}")
+        return
+    _radar_cache_saved[loop_name] = (ring['key'], ring['end_time'])
+    for name in os.listdir(RADAR_CACHE_DIR):
+        if name.startswith(loop_name + "_") and name != file_name:
+            try:
+                os.remove(os.path.join(RADAR_CACHE_DIR, name))
+            except OSError:
+                pass  # Still mapped (Windows won't delete it), goes next time
+
+def get_radar_loop_picture(loop_key_repr):
+    # A loop key (as its repr) without the loop's length in it. frames/interval only say how much of
+    # the picture a loop covers, so a loop of another length still shows the right place.
+    return re.sub(r'&(frames|interval)=\d+', '', loop_key_repr)
+
+def restore_radar_loop(loop_name, build_url, max_age=RADAR_CACHE_MAX_AGE, any_length=False):
+    # Puts the cached loop for this key back as the ring if it's no more than max_age seconds old,
+    # returns True if it did (or the ring already holds this key). The frames point straight into the mapped file.
+    # any_length also takes a loop of another length (the loop policy may have changed since), the
+    # next refresh then fetches a whole new loop anyway.
+    loop_key = get_radar_loop_key(build_url)
+    if any_length:
+        prefix = loop_name + "_"
+        matches_key = lambda key_repr: get_radar_loop_picture(key_repr) == get_radar_loop_picture(repr(loop_key))
+    else:
+        prefix = get_radar_cache_prefix(loop_name, loop_key)
+        matches_key = lambda key_repr: key_repr == repr(loop_key)
+    with _radar_loops_lock:
+        if loop_name in _radar_loops:
+            ring_key = _radar_loops[loop_name]['key']
+            return matches_key(ring_key if isinstance(ring_key, str) else repr(ring_key))
+    try:
+        names = sorted(name for name in os.listdir(RADAR_CACHE_DIR) if name.startswith(prefix) and name.endswith(".bin"))
+    except OSError:
+        return False
+    if not names:
+        return False
+    path = os.path.join(RADAR_CACHE_DIR, names[-1])
+    try:
+        with open(path, 'rb') as f:
+            # Copy-on-write, nothing that draws on a frame can end up in the file
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        header_end = mapped.find(b'\n')
+        header = json.loads(mapped[:header_end])
+        end_time = datetime.fromisoformat(header['end_time'])
+        if not matches_key(header['key']) or (datetime.now() - end_time).total_seconds() > max_age:
+            return False
+
+        raw_format = header['format']
+        palette = [tuple(color) for color in header['palette']] if header['palette'] else None
+        buffer = memoryview(mapped)
+        offset = header_end + 1
+        def next_surface(size):
+            nonlocal offset
+            length = size[0] * size[1] * len(raw_format)
+            surface = pygame.image.frombuffer(buffer[offset:offset + length], size, raw_format)
+            if palette:
+                surface.set_palette(palette)
+            offset += length
+            return surface
+
+        keyframe = next_surface(header['frame_size'])
+        last_frame = next_surface(header['frame_size'])
+        patch_sets = []
+        for rects, compressed_length in zip(header['patches'], header.get('compressed') or [None] * len(header['patches'])):
+            rects = [pygame.Rect(rect) for rect in rects]
+            if compressed_length is None:
+                patch_sets.append(RadarPatchSet([(rect, next_surface(rect.size)) for rect in rects]))
+            else:
+                patch_sets.append(RadarPatchSet.from_compressed(raw_format, palette, rects, buffer[offset:offset + compressed_length]))
+                offset += compressed_length
+        loop = RadarLoop(keyframe, last_frame, patch_sets[:-1], patch_sets[-1], tuple(header['position']))
+    except Exception as e:
+        print(f"Warning: Could not read radar cache {path}: {e}")
+        return False
+
+    # A loop of another length keeps the key it was saved under, so the next refresh won't try to roll it
+    ring = {'key': loop_key if header['key'] == repr(loop_key) else header['key'], 'end_time': end_time,
+            'is_tropical': header['is_tropical'], 'loop': loop, 'durations': header['durations']}
+    with _radar_loops_lock:
+        _radar_loops.setdefault(loop_name, ring)
+    _radar_cache_saved.setdefault(loop_name, (ring['key'], end_time))
+    print(f"Radar loop '{loop_name}': restored from cache ({end_time:%H:%M})")
+    return True
+
+def get_radar_rings_data(loop_names):
+    # radar_data as gather_weather_data hands it out, straight from the rings: radar first, tropical after it
+    with _radar_loops_lock:
+        rings = [_radar_loops[name] for name in loop_names]
+    return [get_radar_loop_frames(ring) + (delay,) for ring, delay in zip(rings, (0, 25000))]
+
+def restore_stale_radar_loops(lat, lon, zip_code, is_tropical=False):
+    # Last resort at startup when there's no fresh radar: whatever loop we still have, up to the
+    # WeatherDataStore's radar MAX_AGE old, beats the fatal error screen. Returns (radar_data, age
+    # in seconds) or (None, None). It may have been decoded for the other mode, the next refresh sorts that out.
+    # The loop also goes into the store as its last good radar, so a failed refresh keeps showing it.
+    max_age = WeatherDataStore.MAX_AGE['radar']
+    if not restore_radar_loop('radar', lambda frames, end_time: build_radar_url(lat, lon, zip_code=zip_code, frames=frames, end_time=end_time),
+                              max_age=max_age, any_length=True):
+        return None, None
+    loop_names = ['radar']
+    if is_tropical and restore_radar_loop('tropical', lambda frames, end_time: build_tropical_url(lat, lon, zip_code=zip_code, frames=frames, end_time=end_time),
+                                          max_age=max_age, any_length=True):
+        loop_names.append('tropical')
+    with _radar_loops_lock:
+        age = (datetime.now() - _radar_loops['radar']['end_time']).total_seconds()
+    print(f"Showing the last radar loop we have ({age / 60:.0f} min old)")
+    radar_data_tuple = get_radar_rings_data(loop_names)
+    get_weather_store(zip_code).remember('radar', {'radar_data': radar_data_tuple}, time.time() - age)
+    return radar_data_tuple, age
+
+def open_newest_radar_frame(build_url):
+    return open_radar_gif_stream(build_url(1, align_radar_time()))
+
+def fetch_newest_radar_frame(build_url, is_tropical=False, gif_stream_future=None):
+    # Just the latest frame (frames=1) as a one frame loop, to have something on screen while the
+    # whole loop downloads. Returns (RadarLoop, durations) or (None, None); doesn't touch the rings.
+    # gif_stream_future is open_newest_radar_frame() already running, so the download can start
+    # before the alerts say which profile (is_tropical) it has to be decoded with.
+    try:
+        gif_stream = gif_stream_future.result() if gif_stream_future else open_newest_radar_frame(build_url)
+        if gif_stream:
+            # One frame isn't worth starting the decode processes for
+            frames, durations, position = decode_radar_gif(gif_stream, is_tropical=is_tropical, pooled=False)
+            if frames:
+                durations[-1] += 1500
+                return RadarLoop.from_frames(frames[-1:], position), durations[-1:]
+    except Exception as e:
+        print(f"Error downloading the newest radar frame: {e}")
+    return None, None
+
+def fetch_tropical_loop(lat, lon, zip_code=None):
+    # The zoomed out goes_ir loop shown alongside the radar during tropical/redmode.
+    try:
+        update = fetch_radar_loop_update('tropical', lambda frames, end_time: build_tropical_url(lat, lon, zip_code=zip_code, frames=frames, end_time=end_time))
+        return apply_radar_loop_update(update, is_tropical=True)
+    except Exception as e:
+        print(f"Error downloading tropical GIF: {e}")
+    return None, None
+
+def describe_radar_error(error):
+    # What the fatal error screen says for a failed radar download
+    if isinstance(error, requests.exceptions.Timeout):
+        return "Connection timed out"
+    if isinstance(error, requests.exceptions.ConnectionError):
+        if "errno -3" in str(error).lower():
+            return "Error: errno -3"
+        return f"Connection error: {error}"
+    return f"Error: {error}"
+
+def fetch_radar_image(zip_code=None, is_tropical=False, radar_update_future=None, tropical_future=None, progress_callback=None):
+    # radar_update_future/tropical_future are the downloads gather_weather_data already has in flight, if any.
+    # zip_code defaults to the one picked at setup.
+    zip_code = zip_code or ZIP_CODE
+    try:
+        lat, lon, _, _ = get_coordinates_from_zip(zip_code)
         if not lat or not lon:
             print("Could not get coordinates")
             # Capture the error from get_coordinates_from_zip if available
@@ -990,105 +2584,22 @@ def fetch_radar_image(is_tropical=False, tropical_thread=None, tropical_results=
                 fetch_radar_image.last_error = "Could not get coordinates from ZIP code"
             return None
 
-        radar_url = build_radar_url(lat, lon, zip_code=ZIP_CODE)
-        def get_gif_frames_and_durations(radar_url):
-            try:
-                response = requests.get(radar_url, stream=True, timeout=60)
-                response.raise_for_status()
-                html_buffer = b''
-                found_link = False
-                for chunk in response.iter_content(chunk_size=1024):
-                    if chunk:
-                        html_buffer += chunk
-                        if b'Download as Animated Gif' in html_buffer:
-                            found_link = True
-                            break
-                response.close()
-                if not found_link:
-                    fetch_radar_image.last_error = "Could not find radar image on the server"
-                    return None, None
-            except requests.exceptions.Timeout:
-                fetch_radar_image.last_error = "Connection timed out"
-                raise
-            except requests.exceptions.ConnectionError as e:
-                if "Errno -3" in str(e).lower():
-                    fetch_radar_image.last_error = "Error: errno -3"
-                else:
-                    fetch_radar_image.last_error = f"Connection error: {e}"
-                raise
-            html_content = html_buffer.decode('utf-8', errors='ignore')
-            soup = BeautifulSoup(html_content, 'html.parser')
-            download_link_element = soup.find('a', string='Download as Animated Gif')
-            if download_link_element:
-                relative_gif_path = download_link_element.get('href')
-                if relative_gif_path:
-                    base_site_url = "https://mesonet.agron.iastate.edu/GIS/apps/rview/"
-                    full_gif_url = urljoin(base_site_url, relative_gif_path)
-                    gif_response = requests.get(full_gif_url, stream=True, timeout=240)
-                    gif_response.raise_for_status()
-                    gif_bytes_in_memory = gif_response.content
-                    gif_file_stream = io.BytesIO(gif_bytes_in_memory)
-                    pil_gif = Image.open(gif_file_stream)
-                    pygame_frames = []
-                    frame_durations_ms = []
-                    for i, frame in enumerate(ImageSequence.Iterator(pil_gif)):
-                        frame_rgba = frame.convert('RGBA')
-                        width, height = frame_rgba.size
-                        # Only crop for tropical GIFs, not for standard radar GIFs
-                        if is_tropical:
-                            crop_top = int(height * 0.1)
-                            cropped_frame = frame_rgba.crop((0, crop_top, width, height))
-                        else:
-                            cropped_frame = frame_rgba
-                        cropped_width, cropped_height = cropped_frame.size
-                        aspect_ratio = cropped_width / cropped_height
-                        screen_aspect = SCREEN_WIDTH / SCREEN_HEIGHT
-                        if aspect_ratio > screen_aspect:
-                            new_height = SCREEN_HEIGHT
-                            new_width = int(SCREEN_HEIGHT * aspect_ratio)
-                        else:
-                            new_width = SCREEN_WIDTH
-                            new_height = int(SCREEN_WIDTH / aspect_ratio)
-                        
-                        # Apply user-selected quality reduction
-                        if QUALITY_FACTOR < 1.0:
-                            # First downscale to reduce pixel count for performance
-                            intermediate_width = int(new_width * QUALITY_FACTOR)
-                            intermediate_height = int(new_height * QUALITY_FACTOR)
-                            downscaled_frame = cropped_frame.resize((intermediate_width, intermediate_height), Image.Resampling.LANCZOS)
-                            # Then scale back up to display size
-                            scaled_frame = downscaled_frame.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                        else:
-                            # Full quality - direct resize
-                            scaled_frame = cropped_frame.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                        pygame_surface = pygame.image.frombytes(scaled_frame.tobytes(), scaled_frame.size, scaled_frame.mode).convert_alpha()
-                        if is_tropical:
-                            offset_y = 40
-                            final_surface = pygame.Surface((pygame_surface.get_width(), pygame_surface.get_height()), pygame.SRCALPHA)
-                            final_surface.blit(pygame_surface, (0, offset_y))
-                        else:
-                            offset_y = -75
-                            final_surface = pygame.Surface((pygame_surface.get_width(), pygame_surface.get_height()), pygame.SRCALPHA)
-                            final_surface.blit(pygame_surface, (0, offset_y))
-                        pygame_frames.append(final_surface)
-                        duration = frame.info.get('duration', 100)
-                        if not isinstance(duration, (int, float)) or duration <= 0:
-                            duration = 100
-                        frame_durations_ms.append(int(duration))
-                    # 1.5/1500ms sec on last frame.
-                    if pygame_frames and frame_durations_ms:
-                        frame_durations_ms[-1] += 1500
-                    return pygame_frames, frame_durations_ms
-            return None, None
-
         # Always get the standard radar GIF
         try:
-            frames1, durations1 = get_gif_frames_and_durations(radar_url)
+            if radar_update_future:
+                radar_update = radar_update_future.result()
+            else:
+                radar_update = fetch_radar_loop_update('radar', lambda frames, end_time: build_radar_url(lat, lon, zip_code=zip_code, frames=frames, end_time=end_time))
+            frames1, durations1 = apply_radar_loop_update(radar_update, is_tropical=is_tropical, progress_callback=progress_callback)
             if frames1 is None or durations1 is None:
-                fetch_radar_image.last_error = "Failed to load radar GIF"
+                if not radar_update['gif_stream']:
+                    # The rview page came back without the GIF link on it
+                    fetch_radar_image.last_error = "Could not find radar image on the server"
+                else:
+                    fetch_radar_image.last_error = "Failed to load radar GIF"
                 return None
         except requests.exceptions.RequestException as req_err:
-            fetch_radar_image.last_error = f"Error: {req_err}"
+            fetch_radar_image.last_error = describe_radar_error(req_err)
             return None
         except Exception as load_err:
             fetch_radar_image.last_error = f"Error: {load_err}"
@@ -1096,10 +2607,8 @@ def fetch_radar_image(is_tropical=False, tropical_thread=None, tropical_results=
 
         if is_tropical:
             # Use the already-started tropical download if available
-            if tropical_thread and tropical_results:
-                # Wait for the tropical download to complete
-                tropical_thread.join()
-                frames2, durations2 = tropical_results[0], tropical_results[1]
+            if tropical_future:
+                frames2, durations2 = tropical_future.result()
                 if frames2 and durations2:
                     return [(frames1, durations1, 0), (frames2, durations2, 25000)]
 
@@ -1113,22 +2622,21 @@ def fetch_radar_image(is_tropical=False, tropical_thread=None, tropical_results=
 
 # ..I have no idea what a User-Agent is but I suppose I need it..
 def get_weather_alerts(zip_code=None, state=None):
+    # The last two are (unchanged, error): NWS said it's the same as last time / why the fetch failed, None if it didn't
     try:
         if zip_code:
             lat, lon, state_from_zip, _ = get_coordinates_from_zip(zip_code)
-            if not lat or not lon: return [], None, None, False
+            if not lat or not lon: return [], None, None, False, False, None
             alerts_url = f"https://api.weather.gov/alerts/active?point={lat},{lon}"
             if not state: state = state_from_zip
         elif state:
             alerts_url = f"https://api.weather.gov/alerts/active?area={state}"
         else:
-            return [], None, None, False
+            return [], None, None, False, False, None
 
-        response = requests.get(alerts_url, headers={'User-Agent': 'Mini8s/v0.3.99family'})
-        response.raise_for_status()
-        data = response.json()
+        data, unchanged = http_get_json(alerts_url)
         features = data.get('features', [])
-        if not features: return [], None, None, False
+        if not features: return [], None, None, False, unchanged, None
         all_alerts = []
         is_tropical = False
 
@@ -1180,11 +2688,11 @@ def get_weather_alerts(zip_code=None, state=None):
         primary_alert_type = all_alerts[0]['event_upper'] if all_alerts else ""
 
         # Return list of alerts
-        return all_alerts, None, primary_alert_type, is_tropical
+        return all_alerts, None, primary_alert_type, is_tropical, unchanged, None
 
     except Exception as e:
         print(f"Error getting weather alerts: {e}")
-        return [], None, None, False
+        return [], None, None, False, False, str(e)
 
 def draw_text(screen, text, pos, font_path, font_size, font_cache, color=(255, 255, 255), center_x=False):
     font_key = (font_path, font_size)
@@ -1233,11 +2741,8 @@ def freetype_draw(text, pos=None, center=None, midtop=None, topleft=None, fontna
         total_width = text_rect.width + outline_size
         total_height = text_rect.height + outline_size
         outline_surface = pygame.Surface((total_width, total_height), pygame.SRCALPHA)
-        
-        for dx in range(-outline_width, outline_width + 1):
-            for dy in range(-outline_width, outline_width + 1):
-                if dx != 0 or dy != 0:  # Skip center position
-                    font.render_to(outline_surface, (outline_width + dx, outline_width + dy), text, outline_color)
+        font.render_to(outline_surface, (0, 0), text, outline_color)
+        dilate_text_outline(outline_surface, outline_width)
         
         # Render main text on top
         font.render_to(outline_surface, (outline_width, outline_width), text, color)
@@ -1248,14 +2753,14 @@ def freetype_draw(text, pos=None, center=None, midtop=None, topleft=None, fontna
         # Resolution-specific positioning offsets for low-res displays
         pos_offset_x = 0
         pos_offset_y = 0
-        if SCREEN_WIDTH < 1280 or SCREEN_HEIGHT < 720:
-            if SCREEN_WIDTH <= 896:  # 896x504 and below
+        if DISPLAY_WIDTH < 1280 or DISPLAY_HEIGHT < 720:
+            if DISPLAY_WIDTH <= 896:  # 896x504 and below
                 pos_offset_x = 2
                 pos_offset_y = 4
-            elif SCREEN_WIDTH <= 960:  # 960x540
+            elif DISPLAY_WIDTH <= 960:  # 960x540
                 pos_offset_x = 1
                 pos_offset_y = 3
-            elif SCREEN_WIDTH <= 1024:  # 1024x576, 1024x600
+            elif DISPLAY_WIDTH <= 1024:  # 1024x576, 1024x600
                 pos_offset_x = 1
                 pos_offset_y = 2
         
@@ -1275,14 +2780,14 @@ def freetype_draw(text, pos=None, center=None, midtop=None, topleft=None, fontna
         # No outline - direct rendering with resolution-specific positioning
         pos_offset_x = 0
         pos_offset_y = 0
-        if SCREEN_WIDTH < 1280 or SCREEN_HEIGHT < 720:
-            if SCREEN_WIDTH <= 896:  # 896x504 and below
+        if DISPLAY_WIDTH < 1280 or DISPLAY_HEIGHT < 720:
+            if DISPLAY_WIDTH <= 896:  # 896x504 and below
                 pos_offset_x = 2
                 pos_offset_y = 3
-            elif SCREEN_WIDTH <= 960:  # 960x540
+            elif DISPLAY_WIDTH <= 960:  # 960x540
                 pos_offset_x = 1
                 pos_offset_y = 2
-            elif SCREEN_WIDTH <= 1024:  # 1024x576, 1024x600
+            elif DISPLAY_WIDTH <= 1024:  # 1024x576, 1024x600
                 pos_offset_x = 1
                 pos_offset_y = 1
         
@@ -1299,9 +2804,9 @@ def freetype_draw(text, pos=None, center=None, midtop=None, topleft=None, fontna
 
 def get_cached_warning_surface(text, fontname, fontsize, color, outline_color, outline_width, italic, cache_dict):
 
-    # Create cache key from all rendering parameters including quality factor
+    # Create cache key from all rendering parameters
     cache_key = (text, fontname, fontsize, tuple(color) if color else None,
-                 tuple(outline_color) if outline_color else None, outline_width, italic, QUALITY_FACTOR)
+                 tuple(outline_color) if outline_color else None, outline_width, italic)
 
     # Return cached surface if it exists
     if cache_key in cache_dict:
@@ -1331,10 +2836,8 @@ def get_cached_warning_surface(text, fontname, fontsize, color, outline_color, o
         surface = pygame.Surface((total_width, total_height), pygame.SRCALPHA)
 
         # Render outline
-        for dx in range(-outline_width, outline_width + 1):
-            for dy in range(-outline_width, outline_width + 1):
-                if dx != 0 or dy != 0:
-                    font.render_to(surface, (outline_width + dx, outline_width + dy), text, outline_color)
+        font.render_to(surface, (0, 0), text, outline_color)
+        dilate_text_outline(surface, outline_width)
 
         # Render main text on top
         font.render_to(surface, (outline_width, outline_width), text, color)
@@ -1343,15 +2846,6 @@ def get_cached_warning_surface(text, fontname, fontsize, color, outline_color, o
         surface = pygame.Surface((text_rect.width, text_rect.height), pygame.SRCALPHA)
         font.render_to(surface, (0, 0), text, color)
 
-    # Apply quality factor scaling (same pattern as panels)
-    if QUALITY_FACTOR < 1.0:
-        original_size = surface.get_size()
-        intermediate_w = int(original_size[0] * QUALITY_FACTOR)
-        intermediate_h = int(original_size[1] * QUALITY_FACTOR)
-        # Scale down then back up for quality reduction
-        intermediate = pygame.transform.smoothscale(surface, (intermediate_w, intermediate_h))
-        surface = pygame.transform.smoothscale(intermediate, original_size)
-
     # Cache and return
     cache_dict[cache_key] = surface
     return surface
@@ -1381,27 +2875,11 @@ def draw_gradient_text(screen, text, pos, font_path, font_size, color_top, color
 
     # Draw outline first if requested
     if outline_color and outline_width > 0:
-        for dx in range(-outline_width, outline_width + 1):
-            for dy in range(-outline_width, outline_width + 1):
-                if dx != 0 or dy != 0:
-                    outline_surface = font.render(text, True, outline_color)
-                    final_surface.blit(outline_surface, (outline_width + dx, outline_width + dy))
-
-    # Create gradient text
-    gradient_surface = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
-
-    # Apply gradient to text pixels
-    for y in range(text_surface.get_height()):
-        ratio = y / text_surface.get_height() if text_surface.get_height() > 0 else 0
-        r = int(color_top[0] * (1 - ratio) + color_bottom[0] * ratio)
-        g = int(color_top[1] * (1 - ratio) + color_bottom[1] * ratio)
-        b = int(color_top[2] * (1 - ratio) + color_bottom[2] * ratio)
-
-        for x in range(text_surface.get_width()):
-            if text_surface.get_at((x, y))[3] > 0:
-                gradient_surface.set_at((x, y), (r, g, b, 255))
+        final_surface.blit(font.render(text, True, outline_color), (0, 0))
+        dilate_text_outline(final_surface, outline_width)
 
-    final_surface.blit(gradient_surface, (outline_width, outline_width))
+    # Gradient text on top
+    final_surface.blit(fill_text_gradient(text_surface, color_top, color_bottom), (outline_width, outline_width))
 
     screen.blit(final_surface, (pos[0] - outline_width, pos[1] - outline_width))
 
@@ -1531,18 +3009,12 @@ def create_forecast_panel_surface(forecast_periods, scaled_config, screen_width,
     panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
     try:
         # Cache the scaled panel texture to avoid disk I/O on every render
-        cache_key = f"panel_bg_{panel_width}x{panel_height}_q{QUALITY_FACTOR}"
+        cache_key = f"panel_bg_{panel_width}x{panel_height}"
         if cache_key in panel_texture_cache:
             panel_bg_texture = panel_texture_cache[cache_key]
         else:
             loaded_tex = pygame.image.load(PANEL_TEXTURE_PATH).convert_alpha()
-            if QUALITY_FACTOR < 1.0:
-                intermediate_w = int(panel_width * QUALITY_FACTOR)
-                intermediate_h = int(panel_height * QUALITY_FACTOR)
-                temp_texture = pygame.transform.smoothscale(loaded_tex, (intermediate_w, intermediate_h))
-                panel_bg_texture = pygame.transform.smoothscale(temp_texture, (panel_width, panel_height))
-            else:
-                panel_bg_texture = pygame.transform.smoothscale(loaded_tex, (panel_width, panel_height))
+            panel_bg_texture = pygame.transform.smoothscale(loaded_tex, (panel_width, panel_height))
             panel_texture_cache[cache_key] = panel_bg_texture
         panel_surface.blit(panel_bg_texture, (0, 0))
     except:
@@ -1611,16 +3083,11 @@ def create_forecast_panel_surface(forecast_periods, scaled_config, screen_width,
             loaded_icon = pygame.image.load(icon_filename).convert_alpha()
         except (FileNotFoundError, IOError):
             loaded_icon = pygame.image.load("textures/icons/weather-none-available.png").convert_alpha()
-        if QUALITY_FACTOR < 1.0:
-            intermediate_size = int(icon_size * QUALITY_FACTOR)
-            temp_icon = pygame.transform.smoothscale(loaded_icon, (intermediate_size, intermediate_size))
-            icon_image = pygame.transform.smoothscale(temp_icon, (icon_size, icon_size))
-        else:
-            icon_image = pygame.transform.smoothscale(loaded_icon, (icon_size, icon_size))
+        icon_image = pygame.transform.smoothscale(loaded_icon, (icon_size, icon_size))
         panel_surface.blit(icon_image, (panel_width - padding - icon_size - 2, y_pos_draw))
-        if SCREEN_WIDTH == 896 and SCREEN_HEIGHT == 504:
+        if DISPLAY_WIDTH == 896 and DISPLAY_HEIGHT == 504:
             y_pos_draw += period_font.get_height() + 1.75
-        elif SCREEN_WIDTH == 960 and SCREEN_HEIGHT == 540:
+        elif DISPLAY_WIDTH == 960 and DISPLAY_HEIGHT == 540:
             y_pos_draw += period_font.get_height() + 2
         else:
             y_pos_draw += period_font.get_height() + 5
@@ -1644,13 +3111,6 @@ def create_forecast_panel_surface(forecast_periods, scaled_config, screen_width,
         if i < len(entries_to_draw) - 1 and y_pos_draw < panel_height - padding:
              pygame.draw.line(panel_surface, (100, 100, 100), (padding, y_pos_draw - (spacing_between_entries / 2)), (panel_width - padding, y_pos_draw - (spacing_between_entries / 2)), 1)
 
-    # Apply quality reduction to the entire composed panel
-    if QUALITY_FACTOR < 1.0:
-        intermediate_w = int(panel_width * QUALITY_FACTOR)
-        intermediate_h = int(panel_height * QUALITY_FACTOR)
-        temp_panel = pygame.transform.smoothscale(panel_surface, (intermediate_w, intermediate_h))
-        panel_surface = pygame.transform.smoothscale(temp_panel, (panel_width, panel_height))
-
     return panel_surface
 
 def create_current_conditions_surface(current, location_name, scaled_config, panel_texture_cache, weather_icon_cache, font_cache, primary_alert_type=None):
@@ -1677,18 +3137,12 @@ def create_current_conditions_surface(current, location_name, scaled_config, pan
     panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
     try:
         # Cache the scaled panel texture to avoid disk I/O on every render
-        cache_key = f"panel_bg_{panel_width}x{panel_height}_q{QUALITY_FACTOR}"
+        cache_key = f"panel_bg_{panel_width}x{panel_height}"
         if cache_key in panel_texture_cache:
             panel_bg_texture = panel_texture_cache[cache_key]
         else:
             loaded_tex = pygame.image.load(PANEL_TEXTURE_PATH).convert_alpha()
-            if QUALITY_FACTOR < 1.0:
-                intermediate_w = int(panel_width * QUALITY_FACTOR)
-                intermediate_h = int(panel_height * QUALITY_FACTOR)
-                temp_texture = pygame.transform.smoothscale(loaded_tex, (intermediate_w, intermediate_h))
-                panel_bg_texture = pygame.transform.smoothscale(temp_texture, (panel_width, panel_height))
-            else:
-                panel_bg_texture = pygame.transform.smoothscale(loaded_tex, (panel_width, panel_height))
+            panel_bg_texture = pygame.transform.smoothscale(loaded_tex, (panel_width, panel_height))
             panel_texture_cache[cache_key] = panel_bg_texture
         panel_surface.blit(panel_bg_texture, (0, 0))
     except:
@@ -1724,12 +3178,7 @@ def create_current_conditions_surface(current, location_name, scaled_config, pan
         loaded_icon = pygame.image.load(icon_filename).convert_alpha()
     except (FileNotFoundError, IOError):
         loaded_icon = pygame.image.load("textures/icons/weather-none-available.png").convert_alpha()
-    if QUALITY_FACTOR < 1.0:
-        intermediate_size = int(icon_size_val * QUALITY_FACTOR)
-        temp_icon = pygame.transform.smoothscale(loaded_icon, (intermediate_size, intermediate_size))
-        icon_image = pygame.transform.smoothscale(temp_icon, (icon_size_val, icon_size_val))
-    else:
-        icon_image = pygame.transform.smoothscale(loaded_icon, (icon_size_val, icon_size_val))
+    icon_image = pygame.transform.smoothscale(loaded_icon, (icon_size_val, icon_size_val))
     panel_surface.blit(icon_image, ((panel_width - icon_size_val) // 2, y_pos)); y_pos += icon_size_val + 15
 
     is_heat_alert = primary_alert_type and ("HEAT" in primary_alert_type.upper())
@@ -1817,13 +3266,6 @@ def create_current_conditions_surface(current, location_name, scaled_config, pan
                              surf=panel_surface)
             y_pos += dynamic_line_height
 
-    # Apply quality reduction to the entire composed panel
-    if QUALITY_FACTOR < 1.0:
-        intermediate_w = int(panel_width * QUALITY_FACTOR)
-        intermediate_h = int(panel_height * QUALITY_FACTOR)
-        temp_panel = pygame.transform.smoothscale(panel_surface, (intermediate_w, intermediate_h))
-        panel_surface = pygame.transform.smoothscale(temp_panel, (panel_width, panel_height))
-
     return panel_surface
 
 # Panel flipping animation, I should probably change the names of these variables later!
@@ -1853,83 +3295,36 @@ def create_panel_partial_flip_surfaces(panel_surface_to_animate, original_panel_
 
         scaled_width_shrink = max(0, int(original_panel_width * scale_shrink))
         if scaled_width_shrink > 0 :
-            if QUALITY_FACTOR < 1.0:
-                intermediate_w = int(scaled_width_shrink * QUALITY_FACTOR)
-                intermediate_h = int(panel_height * QUALITY_FACTOR)
-                temp_frame = pygame.transform.smoothscale(panel_surface_to_animate, (intermediate_w, intermediate_h))
-                shrink_frames.append(pygame.transform.smoothscale(temp_frame, (scaled_width_shrink, panel_height)))
-            else:
-                shrink_frames.append(pygame.transform.smoothscale(panel_surface_to_animate, (scaled_width_shrink, panel_height)))
+            shrink_frames.append(pygame.transform.smoothscale(panel_surface_to_animate, (scaled_width_shrink, panel_height)))
         else:
             shrink_frames.append(pygame.Surface((0, panel_height), pygame.SRCALPHA))
 
         scale_expand = i / num_animation_steps if num_animation_steps > 0 else 1.0
         scaled_width_expand = max(0, int(original_panel_width * scale_expand))
         if scaled_width_expand > 0:
-            if QUALITY_FACTOR < 1.0:
-                intermediate_w = int(scaled_width_expand * QUALITY_FACTOR)
-                intermediate_h = int(panel_height * QUALITY_FACTOR)
-                temp_frame = pygame.transform.smoothscale(panel_surface_to_animate, (intermediate_w, intermediate_h))
-                expand_frames.append(pygame.transform.smoothscale(temp_frame, (scaled_width_expand, panel_height)))
-            else:
-                expand_frames.append(pygame.transform.smoothscale(panel_surface_to_animate, (scaled_width_expand, panel_height)))
+            expand_frames.append(pygame.transform.smoothscale(panel_surface_to_animate, (scaled_width_expand, panel_height)))
         else:
             expand_frames.append(pygame.Surface((0, panel_height), pygame.SRCALPHA))
 
     return shrink_frames, expand_frames
 
-def create_all_pre_rendered_frames(radar_frames_list, conditions_panel_full, forecast_panel_full, title_text, mini8s_logo, logo_rect,
-                                   current_bar_texture, warning_text, scaled_config, font_cache, panel_flip_anim_steps_config):
+def create_all_pre_rendered_frames(radar_frames_list, conditions_panel_full, forecast_panel_full, scaled_config, panel_flip_anim_steps_config):
 
-    global base_common_frames_global, pre_rendered_frames_conditions, pre_rendered_frames_forecast
     global panel_shrink_cond_surfaces, panel_expand_cond_surfaces, panel_shrink_fcst_surfaces, panel_expand_fcst_surfaces
 
     # Clear all old frames
-    base_common_frames_global.clear()
-    pre_rendered_frames_conditions.clear()
-    pre_rendered_frames_forecast.clear()
     panel_shrink_cond_surfaces.clear()
     panel_expand_cond_surfaces.clear()
     panel_shrink_fcst_surfaces.clear()
     panel_expand_fcst_surfaces.clear()
 
-    if radar_frames_list:
-        # Uses the last frame and pauses with it for its set time..
-        base_frame = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        base_frame.fill((0, 0, 0))
-
-        # Only process the LAST radar frame!
-        last_frame_img = radar_frames_list[-1]
-        frame_rect = last_frame_img.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        base_frame.blit(last_frame_img, frame_rect)
-        draw_text(base_frame, title_text, scaled_config["TITLE_CONFIG"]["position"], scaled_config["TITLE_CONFIG"]["font_path"], scaled_config["TITLE_CONFIG"]["font_size"], font_cache, scaled_config["TITLE_CONFIG"]["color"])
-        if mini8s_logo:
-            base_frame.blit(mini8s_logo, logo_rect)
-        if current_bar_texture:
-            bar_rect = current_bar_texture.get_rect()
-            bar_rect.topleft = (0, SCREEN_HEIGHT - bar_rect.height)
-            base_frame.blit(current_bar_texture, bar_rect)
-        draw_text(base_frame, warning_text, scaled_config["TKR_WARNING_TITLE_CONFIG"]["position"], scaled_config["TKR_WARNING_TITLE_CONFIG"]["font_path"], scaled_config["TKR_WARNING_TITLE_CONFIG"]["font_size"], font_cache, scaled_config["TKR_WARNING_TITLE_CONFIG"]["color"])
-        base_common_frames_global.append(base_frame)
-    else:
+    if not radar_frames_list:
         # Log the fatal error
         error_msg = getattr(fetch_radar_image, 'last_error', 'Unknown error - radar GIF failed to load')
         log_fatal_error(error_msg)
         return  # Exit early on error
 
-    # Only process panels if we're not in BSOD mode
-    panel_pos = scaled_config["CURRENT_CONDITIONS_CONFIG"]["position"]
-    for base_common_frame_with_radar in base_common_frames_global:
-        if conditions_panel_full:
-            frame_cond = base_common_frame_with_radar.copy()
-            frame_cond.blit(conditions_panel_full, panel_pos)
-            pre_rendered_frames_conditions.append(frame_cond.convert_alpha())
-
-        if forecast_panel_full:
-            frame_fcst = base_common_frame_with_radar.copy()
-            frame_fcst.blit(forecast_panel_full, panel_pos)
-            pre_rendered_frames_forecast.append(frame_fcst.convert_alpha())
-
+    # Only process panels if we're not in BSOD mode. The panels themselves get blitted straight from these surfaces.
     panel_original_width = scaled_config["CURRENT_CONDITIONS_CONFIG"]["width"]
     if conditions_panel_full:
         panel_shrink_cond_surfaces, panel_expand_cond_surfaces = create_panel_partial_flip_surfaces(
@@ -1946,13 +3341,7 @@ def draw_loading_screen(screen, message="Loading...", font_cache=None, motd_text
     try:
         bg_image = pygame.image.load("textures/graphics/background.png").convert()
         # Scale background to fit screen
-        if QUALITY_FACTOR < 1.0:
-            intermediate_w = int(display_width * QUALITY_FACTOR)
-            intermediate_h = int(display_height * QUALITY_FACTOR)
-            temp_bg = pygame.transform.smoothscale(bg_image, (intermediate_w, intermediate_h))
-            bg_image = pygame.transform.smoothscale(temp_bg, (display_width, display_height))
-        else:
-            bg_image = pygame.transform.smoothscale(bg_image, (display_width, display_height))
+        bg_image = pygame.transform.smoothscale(bg_image, (display_width, display_height))
         screen.blit(bg_image, (0, 0))
     except Exception as e:
         screen.fill((0, 0, 0))
@@ -1977,13 +3366,7 @@ def draw_loading_screen(screen, message="Loading...", font_cache=None, motd_text
         aspect_ratio = message_img.get_width() / message_img.get_height()
         target_width = int(target_height * aspect_ratio)
 
-        if QUALITY_FACTOR < 1.0:
-            intermediate_w = int(target_width * QUALITY_FACTOR)
-            intermediate_h = int(target_height * QUALITY_FACTOR)
-            temp_msg = pygame.transform.smoothscale(message_img, (intermediate_w, intermediate_h))
-            message_img = pygame.transform.smoothscale(temp_msg, (target_width, target_height))
-        else:
-            message_img = pygame.transform.smoothscale(message_img, (target_width, target_height))
+        message_img = pygame.transform.smoothscale(message_img, (target_width, target_height))
 
         message_rect = message_img.get_rect(center=(display_width // 2, display_height // 2 - scale_value(80, scale_y)))
         screen.blit(message_img, message_rect)
@@ -2018,13 +3401,7 @@ def draw_loading_screen(screen, message="Loading...", font_cache=None, motd_text
         logo_scale = min(scale_x, scale_y) * 0.65
         target_w = int(version_logo.get_width() * logo_scale)
         target_h = int(version_logo.get_height() * logo_scale)
-        if QUALITY_FACTOR < 1.0:
-            intermediate_w = int(target_w * QUALITY_FACTOR)
-            intermediate_h = int(target_h * QUALITY_FACTOR)
-            temp_logo = pygame.transform.smoothscale(version_logo, (intermediate_w, intermediate_h))
-            version_logo = pygame.transform.smoothscale(temp_logo, (target_w, target_h))
-        else:
-            version_logo = pygame.transform.smoothscale(version_logo, (target_w, target_h))
+        version_logo = pygame.transform.smoothscale(version_logo, (target_w, target_h))
         logo_rect = version_logo.get_rect(center=(display_width // 2,
                                                    display_height // 2 + scale_value(120, scale_y)))
         screen.blit(version_logo, logo_rect)
@@ -2042,7 +3419,48 @@ def draw_loading_screen(screen, message="Loading...", font_cache=None, motd_text
 
     # Process events to keep window responsive during loading, big bug fix!
     pygame.event.pump()
-    pygame.display.flip()
+    present_frame(screen)
+
+def get_render_size(display_width, display_height, quality_factor=None):
+    quality_factor = QUALITY_FACTOR if quality_factor is None else quality_factor
+    if quality_factor >= 1.0:
+        return display_width, display_height
+    return max(1, int(display_width * quality_factor)), max(1, int(display_height * quality_factor))
+
+def upscale_dirty_rect(screen, display_surface, rect):
+    # Scales one dirty rect of the reduced-size render target onto the window, returns the window rect it covered.
+    # transform.scale maps the render target in blocks that come out as a whole number of window pixels, and a
+    # block scaled on its own comes out exactly like it does as part of the whole frame. So the rect gets grown
+    # out to those blocks first (an odd render size can make them as wide as the frame, that still works).
+    (screen_width, screen_height), (display_width, display_height) = screen.get_size(), display_surface.get_size()
+    blocks_across, blocks_down = math.gcd(screen_width, display_width), math.gcd(screen_height, display_height)
+    block_width, block_height = screen_width // blocks_across, screen_height // blocks_down
+    scaled_width, scaled_height = display_width // blocks_across, display_height // blocks_down
+    left, top = rect.left // block_width, rect.top // block_height
+    right, bottom = -(-rect.right // block_width), -(-rect.bottom // block_height)
+    source = pygame.Rect(left * block_width, top * block_height, (right - left) * block_width, (bottom - top) * block_height)
+    covered = pygame.Rect(left * scaled_width, top * scaled_height, (right - left) * scaled_width, (bottom - top) * scaled_height)
+    display_surface.blit(pygame.transform.scale(screen.subsurface(source), covered.size), covered)
+    return covered
+
+def present_frame(screen, dirty_rects=None):
+    # screen is either the window itself or the reduced-size render target, the latter gets upscaled here.
+    # dirty_rects (screen coordinates) limits the update to those, None means the whole frame changed.
+    display_surface = pygame.display.get_surface()
+    if screen is not display_surface:
+        # This used to smoothscale the whole frame and flip the whole window every time, which undid the dirty
+        # rects at reduced quality, on the slow machines that pick it. smoothscale can't do it rect by rect
+        # (its sampling depends on the size being scaled, so the rects wouldn't line up with what's around
+        # them), transform.scale can, so reduced quality upscales with that instead, whole frames included.
+        if dirty_rects is None:
+            pygame.transform.scale(screen, display_surface.get_size(), display_surface)
+            pygame.display.flip()
+        elif dirty_rects:
+            pygame.display.update([upscale_dirty_rect(screen, display_surface, rect) for rect in dirty_rects])
+    elif dirty_rects is None:
+        pygame.display.flip()
+    elif dirty_rects:
+        pygame.display.update(dirty_rects)
 
     # EVERYTHING HERE IS PYQT5 SETUP SCREEN LOGIC!
 
@@ -2075,7 +3493,7 @@ def check_for_updates():
     api_url = "https://api.github.com/repos/StarzainiaMini8s/mini8s/releases"
 
     try:
-        response = requests.get(api_url, timeout=10)
+        response = http_get(api_url, timeout=10)
         response.raise_for_status()
         releases = response.json()
 
@@ -2188,18 +3606,18 @@ def download_update(url, destination, progress_callback=None):
     Returns True on success, False on failure.
     """
     try:
-        response = requests.get(url, stream=True, timeout=30)
-        response.raise_for_status()
-        total_size = int(response.headers.get('content-length', 0))
+        with http_get(url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            total_size = int(response.headers.get('content-length', 0))
 
-        with open(destination, 'wb') as f:
-            downloaded = 0
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if progress_callback and total_size > 0:
-                        progress_callback(downloaded, total_size)
+            with open(destination, 'wb') as f:
+                downloaded = 0
+                for chunk in response.iter_content(chunk_size=8192):
+                    if chunk:
+                        f.write(chunk)
+                        downloaded += len(chunk)
+                        if progress_callback and total_size > 0:
+                            progress_callback(downloaded, total_size)
 
         return True
     except Exception as e:
@@ -3019,16 +4437,18 @@ class Mini8sWelcome(QMainWindow):
             quality = None
             quality_factor = 1.0
 
-        # Save configuration
-        new_config = {
+        # Save configuration, keeping anything set by hand in config.json (radar_memory_budget_mb etc)
+        new_config = dict(self.saved_config)
+        new_config.update({
             "last_width": width,
             "last_height": height,
             "last_zip": zip_code,
             "show_fps": self.fps_counter_action.isChecked(),
             "disable_vsync": self.disable_vsync_action.isChecked()
-        }
+        })
 
         # Only add quality if it's not full (None means full/default)
+        new_config.pop("quality", None)
         if quality is not None:
             new_config["quality"] = quality
 
@@ -3058,6 +4478,7 @@ class Mini8sWelcome(QMainWindow):
 
 def initialize_mini8s():
     global TARGET_FPS, pre_rendered_conditions_surface, pre_rendered_forecast_surface
+    global SCREEN_WIDTH, SCREEN_HEIGHT, DISPLAY_WIDTH, DISPLAY_HEIGHT
     print(f"Mini8s {VERSION} by Starzainia and HexagonMidis!")
 
     # Load resolution validation file
@@ -3083,6 +4504,8 @@ def initialize_mini8s():
     SCREEN_WIDTH = saved_config.get("last_width", 1280)
     SCREEN_HEIGHT = saved_config.get("last_height", 720)
     ZIP_CODE = saved_config.get("last_zip", "")
+    if "radar_memory_budget_mb" in saved_config:
+        configure_radar_memory_budget(saved_config["radar_memory_budget_mb"])
 
     # Preserve the entire config (including advanced settings like show_fps, disable_vsync, quality)
     # Only update the basic fields that may have changed
@@ -3105,11 +4528,19 @@ def initialize_mini8s():
     ticker_text_cache = {}
     played_alerts = set()
 
-    screen = pygame.display.set_mode(
-        (SCREEN_WIDTH, SCREEN_HEIGHT),
+    # Everything below lays out and draws at the render size, only the window itself is DISPLAY_WIDTH x DISPLAY_HEIGHT
+    DISPLAY_WIDTH, DISPLAY_HEIGHT = SCREEN_WIDTH, SCREEN_HEIGHT
+    SCREEN_WIDTH, SCREEN_HEIGHT = get_render_size(DISPLAY_WIDTH, DISPLAY_HEIGHT)
+    display_surface = pygame.display.set_mode(
+        (DISPLAY_WIDTH, DISPLAY_HEIGHT),
         pygame.HWSURFACE | pygame.DOUBLEBUF,
         vsync=1 if VSYNC_ENABLED else 0
     )
+    if (SCREEN_WIDTH, SCREEN_HEIGHT) == (DISPLAY_WIDTH, DISPLAY_HEIGHT):
+        screen = display_surface
+    else:
+        print(f"Rendering at {SCREEN_WIDTH}x{SCREEN_HEIGHT}, scaled up to {DISPLAY_WIDTH}x{DISPLAY_HEIGHT}")
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
     scale_x, scale_y = calculate_scale_factors(SCREEN_WIDTH, SCREEN_HEIGHT)
     current_motd = get_random_motd(is_tropical=False, is_redmode=False)
 
@@ -3220,22 +4651,9 @@ def initialize_mini8s():
     current_alert_level = None
 
     try:
-        if QUALITY_FACTOR < 1.0:
-            intermediate_w = int(SCREEN_WIDTH * QUALITY_FACTOR)
-            intermediate_h = int(scaled_bottom_bar_height * QUALITY_FACTOR)
-
-            temp_watch = pygame.transform.smoothscale(pygame.image.load(WATCH_BAR_TEXTURE_PATH).convert_alpha(), (intermediate_w, intermediate_h))
-            watch_bar_texture = pygame.transform.smoothscale(temp_watch, (SCREEN_WIDTH, scaled_bottom_bar_height))
-
-            temp_statement = pygame.transform.smoothscale(pygame.image.load(STATEMENT_BAR_TEXTURE_PATH).convert_alpha(), (intermediate_w, intermediate_h))
-            statement_bar_texture = pygame.transform.smoothscale(temp_statement, (SCREEN_WIDTH, scaled_bottom_bar_height))
-
-            temp_alert = pygame.transform.smoothscale(pygame.image.load(ALERT_BAR_TEXTURE_PATH).convert_alpha(), (intermediate_w, intermediate_h))
-            alert_bar_texture = pygame.transform.smoothscale(temp_alert, (SCREEN_WIDTH, scaled_bottom_bar_height))
-        else:
-            watch_bar_texture = pygame.transform.smoothscale(pygame.image.load(WATCH_BAR_TEXTURE_PATH).convert_alpha(), (SCREEN_WIDTH, scaled_bottom_bar_height))
-            statement_bar_texture = pygame.transform.smoothscale(pygame.image.load(STATEMENT_BAR_TEXTURE_PATH).convert_alpha(), (SCREEN_WIDTH, scaled_bottom_bar_height))
-            alert_bar_texture = pygame.transform.smoothscale(pygame.image.load(ALERT_BAR_TEXTURE_PATH).convert_alpha(), (SCREEN_WIDTH, scaled_bottom_bar_height))
+        watch_bar_texture = pygame.transform.smoothscale(pygame.image.load(WATCH_BAR_TEXTURE_PATH).convert_alpha(), (SCREEN_WIDTH, scaled_bottom_bar_height))
+        statement_bar_texture = pygame.transform.smoothscale(pygame.image.load(STATEMENT_BAR_TEXTURE_PATH).convert_alpha(), (SCREEN_WIDTH, scaled_bottom_bar_height))
+        alert_bar_texture = pygame.transform.smoothscale(pygame.image.load(ALERT_BAR_TEXTURE_PATH).convert_alpha(), (SCREEN_WIDTH, scaled_bottom_bar_height))
     except Exception as e: print(f"Bar texture error: {e}"); pygame.quit(); sys.exit()
 
     alert_list = []
@@ -3248,13 +4666,7 @@ def initialize_mini8s():
     try:
         logo_orig = pygame.image.load(logo_path).convert_alpha()
         logo_w, logo_h = scaled_config["LOGO_CONFIG"]["width"], int(scaled_config["LOGO_CONFIG"]["width"] * (logo_orig.get_height() / logo_orig.get_width()))
-        if QUALITY_FACTOR < 1.0:
-            intermediate_w = int(logo_w * QUALITY_FACTOR)
-            intermediate_h = int(logo_h * QUALITY_FACTOR)
-            temp_logo = pygame.transform.smoothscale(logo_orig, (intermediate_w, intermediate_h))
-            mini8s_logo = pygame.transform.smoothscale(temp_logo, (logo_w, logo_h))
-        else:
-            mini8s_logo = pygame.transform.smoothscale(logo_orig, (logo_w, logo_h))
+        mini8s_logo = pygame.transform.smoothscale(logo_orig, (logo_w, logo_h))
         logo_rect = mini8s_logo.get_rect(topright=(SCREEN_WIDTH - scaled_config["LOGO_CONFIG"]["margin_right"], scaled_config["LOGO_CONFIG"]["margin_top"]))
     except Exception as e:
         print(f"Logo error: {e}")
@@ -3276,34 +4688,10 @@ def initialize_mini8s():
         redmode_width = int(target_height * redmode_aspect)
         tropical_redmode_width = int(target_height * tropical_redmode_aspect)
 
-        # Apply user-selected quality reduction
-        if QUALITY_FACTOR < 1.0:
-            intermediate_normal_width = int(normal_width * QUALITY_FACTOR)
-            intermediate_normal_height = int(target_height * QUALITY_FACTOR)
-            intermediate_tropical_width = int(tropical_width * QUALITY_FACTOR)
-            intermediate_tropical_height = int(target_height * QUALITY_FACTOR)
-            intermediate_redmode_width = int(redmode_width * QUALITY_FACTOR)
-            intermediate_redmode_height = int(target_height * QUALITY_FACTOR)
-            intermediate_tropical_redmode_width = int(tropical_redmode_width * QUALITY_FACTOR)
-            intermediate_tropical_redmode_height = int(target_height * QUALITY_FACTOR)
-
-            title_4hr_normal_temp = pygame.transform.smoothscale(title_4hr_normal_orig, (intermediate_normal_width, intermediate_normal_height))
-            title_4hr_normal = pygame.transform.smoothscale(title_4hr_normal_temp, (normal_width, target_height))
-
-            title_4hr_tropical_temp = pygame.transform.smoothscale(title_4hr_tropical_orig, (intermediate_tropical_width, intermediate_tropical_height))
-            title_4hr_tropical = pygame.transform.smoothscale(title_4hr_tropical_temp, (tropical_width, target_height))
-
-            title_4hr_redmode_temp = pygame.transform.smoothscale(title_4hr_redmode_orig, (intermediate_redmode_width, intermediate_redmode_height))
-            title_4hr_redmode = pygame.transform.smoothscale(title_4hr_redmode_temp, (redmode_width, target_height))
-
-            title_4hr_tropical_redmode_temp = pygame.transform.smoothscale(title_4hr_tropical_redmode_orig, (intermediate_tropical_redmode_width, intermediate_tropical_redmode_height))
-            title_4hr_tropical_redmode = pygame.transform.smoothscale(title_4hr_tropical_redmode_temp, (tropical_redmode_width, target_height))
-        else:
-            # Full quality
-            title_4hr_normal = pygame.transform.smoothscale(title_4hr_normal_orig, (normal_width, target_height))
-            title_4hr_tropical = pygame.transform.smoothscale(title_4hr_tropical_orig, (tropical_width, target_height))
-            title_4hr_redmode = pygame.transform.smoothscale(title_4hr_redmode_orig, (redmode_width, target_height))
-            title_4hr_tropical_redmode = pygame.transform.smoothscale(title_4hr_tropical_redmode_orig, (tropical_redmode_width, target_height))
+        title_4hr_normal = pygame.transform.smoothscale(title_4hr_normal_orig, (normal_width, target_height))
+        title_4hr_tropical = pygame.transform.smoothscale(title_4hr_tropical_orig, (tropical_width, target_height))
+        title_4hr_redmode = pygame.transform.smoothscale(title_4hr_redmode_orig, (redmode_width, target_height))
+        title_4hr_tropical_redmode = pygame.transform.smoothscale(title_4hr_tropical_redmode_orig, (tropical_redmode_width, target_height))
     except Exception as e:
         print(f"Error loading title images: {e}")
         # Fallback to None if images not found
@@ -3339,11 +4727,16 @@ def initialize_mini8s():
         font_cache[fps_font_key] = pygame.font.SysFont(None, fps_font_size, bold=True)
     fps_font = font_cache[fps_font_key]
 
+    # Loop length has to be settled before anything builds a radar URL (it's part of the cache key too)
+    configure_radar_loop(saved_config.get("radar_loop"))
+
 # Anti-freezing worker thread.. This is part of the logic that stops the loading screen from looking frozen
     init_queue = queue.Queue(maxsize=1)
     progress_queue = queue.Queue()  # For stage progress updates
     init_stop_event = threading.Event()
-    init_worker = InitializationWorker(ZIP_CODE, init_queue, progress_queue, init_stop_event)
+    # Also gets the rest of the radar loop from the init worker after a progressive start
+    weather_queue = queue.Queue(maxsize=2)
+    init_worker = InitializationWorker(ZIP_CODE, init_queue, progress_queue, init_stop_event, update_queue=weather_queue)
     init_worker.start()
     
     # Initialize variables with defaults
@@ -3358,6 +4751,9 @@ def initialize_mini8s():
     pre_rendered_conditions_surface = None
     pre_rendered_forecast_surface = None
     radar_data_tuple = None
+    radar_from_cache = False
+    data_age = {}  # Groups being served from the store and how old they were when they arrived, see describe_data_age()
+    data_age_since = time.time()
     init_data_received = False
     current_motd = get_random_motd(is_tropical=False, is_redmode=False)
     
@@ -3367,9 +4763,12 @@ def initialize_mini8s():
     while not init_data_received:
         # Check for progress updates on during loading
         try:
-            progress = progress_queue.get_nowait()
-            if progress.get('stage') == 'loading_radar':
-                loading_message = "Loading Radar Data..."
+            while True:
+                progress = progress_queue.get_nowait()
+                if progress.get('stage') == 'loading_radar':
+                    loading_message = "Loading Radar Data..."
+                    if progress.get('frames_total'):
+                        loading_message = f"Loading Radar Data... {progress['frames_done'] * 100 // progress['frames_total']}%"
         except queue.Empty:
             pass
         
@@ -3405,6 +4804,9 @@ def initialize_mini8s():
             is_tropical = init_data['is_tropical']
             is_redmode = init_data['is_redmode']
             radar_data_tuple = init_data['radar_data']
+            radar_from_cache = init_data.get('radar_from_cache', False)
+            data_age = init_data.get('data_age', {})
+            data_age_since = time.time()
             
             # Update MOTD based on alert type
             if is_redmode:
@@ -3505,6 +4907,7 @@ def initialize_mini8s():
     current_radar_frame_idx, last_radar_update_time = 0, pygame.time.get_ticks()
     # This value controls the speed of the radar loop!
     SPEED_FACTOR = 18
+    radar_loop_pace = get_radar_loop_pace()
 
     radar_gif_list = []
     if radar_data_tuple:
@@ -3528,13 +4931,11 @@ def initialize_mini8s():
     fade_duration = 1000
     next_gif_idx = 0
 
-    # For compatibility with create_all_pre_rendered_frames, set radar_frames_raw to the first GIF's frames (or empty)
-    radar_frames_raw = radar_gif_frames[0][:] if radar_gif_frames and radar_gif_frames[0] else []
+    radar_frames_raw = radar_gif_frames[0] if radar_gif_frames and radar_gif_frames[0] else []
     draw_loading_screen(screen, "Pre-Rendering...", **loading_screen_params)
     create_all_pre_rendered_frames(
         radar_frames_raw, pre_rendered_conditions_surface, pre_rendered_forecast_surface,
-        title_text, mini8s_logo, logo_rect, current_bar_texture, warning_text,
-        scaled_config, font_cache, PANEL_FLIP_ANIMATION_STEPS
+        scaled_config, PANEL_FLIP_ANIMATION_STEPS
     )
     
     # Play pending alert audio now that pre-rendering is complete
@@ -3549,7 +4950,6 @@ def initialize_mini8s():
     is_transitioning = False
     panel_to_blit_during_flip = None
 
-    weather_queue = queue.Queue(maxsize=2)
     stop_event = threading.Event()
     weather_worker = WeatherDataWorker(ZIP_CODE, weather_queue, stop_event)
     
@@ -3558,7 +4958,8 @@ def initialize_mini8s():
         weather_worker.start()
         print("Background weather worker thread started")
     
-    weather_timer = threading.Timer(300.0, start_weather_worker)  # 300 seconds = 5 minutes
+    # Started from the disk cache? Then the first refresh goes out now rather than in 5 minutes.
+    weather_timer = threading.Timer(1.0 if radar_from_cache else 300.0, start_weather_worker)  # 300 seconds = 5 minutes
     weather_timer.start()
 
     # Initialize ticker variables — don't overwrite if already set during initialization
@@ -3576,10 +4977,40 @@ def initialize_mini8s():
     panel_to_blit_during_flip = None
     panel_render_pos_tuple = scaled_config["CURRENT_CONDITIONS_CONFIG"]["position"]
 
+    radar_playback = RadarPlayback()
+    data_age_text = None
+    data_age_surface = None
+    force_full_redraw = True
+    drawn_display_mode = None
+    drawn_fps_rect = None
+
+    def draw_scene():
+        # Everything on screen, back to front. Gets called once per dirty rect with the screen
+        # clipped to it, so it must only draw (all the per-frame state is worked out beforehand).
+        if active_radar_frame:
+            screen.blit(active_radar_frame, active_radar_loop.position)
+            if location_dot_pos:
+                screen.blit(location_dot_original, location_dot_pos)
+        for part in overlay_parts:
+            screen.blit(*part)
+
+        if is_transitioning and panel_to_blit_during_flip:
+            current_panel_w = panel_to_blit_during_flip.get_width()
+            blit_x = panel_render_pos_tuple[0] + (panel_original_width_for_centering - current_panel_w) // 2
+            screen.blit(panel_to_blit_during_flip, (blit_x, panel_render_pos_tuple[1]))
+
+        if ticker_blit:
+            screen.blit(ticker_surface, *ticker_blit)
+
+        if fps_blit:
+            screen.blit(*fps_blit)
+
     while running:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                force_full_redraw = True
         current_ticks_ms = pygame.time.get_ticks()
 
         if not is_transitioning and current_ticks_ms - last_panel_switch_time >= PANEL_CYCLE_INTERVAL:
@@ -3643,18 +5074,22 @@ def initialize_mini8s():
             if weather_data.get('lat') and weather_data.get('lon'):
                 title_text = f"4 Hour Radar"
                 location_name = weather_data.get('location_name', 'Unknown Location')
+                data_age = weather_data.get('data_age', {})
+                data_age_since = time.time()
 
                 current_conditions_data = weather_data.get('current_conditions')
-                alert_type_val = weather_data.get('alert_type')
-                if current_conditions_data:
+                new_alert_type_val = weather_data.get('alert_type')
+                # The temperature color depends on the alert type too, so only reuse the panel if neither changed
+                keep_conditions_panel = (weather_data.get('conditions_unchanged', False) and new_alert_type_val == alert_type_val
+                                         and pre_rendered_conditions_surface is not None)
+                alert_type_val = new_alert_type_val
+                if current_conditions_data and not keep_conditions_panel:
                     pre_rendered_conditions_surface = create_current_conditions_surface(
                         current_conditions_data, location_name, scaled_config,
                         panel_texture_cache, weather_icon_cache, font_cache,
                         primary_alert_type=alert_type_val
                     )
 
-                alert_list = weather_data.get('alert_list', [])
-                warning_text_cache.clear()
                 # Only clear title cache if we're implementing the tropical or redmode change
                 if is_tropical != weather_data.get('is_tropical', False) or is_redmode != weather_data.get('is_redmode', False):
                     gradient_title_cache.clear()
@@ -3663,75 +5098,80 @@ def initialize_mini8s():
                 is_tropical = weather_data.get('is_tropical', False)
                 is_redmode = weather_data.get('is_redmode', False)
 
-                current_bar_texture = None
-                current_alert_level = None
-
-                if alert_list:
-                    single_alert_mode = (len(alert_list) == 1)
-                    current_alert_index = 0
-                    ticker_scroll_count = 0
-                    current_alert = alert_list[current_alert_index]
+                # Same alerts as last time? Then leave the ticker where it is instead of restarting it.
+                if not weather_data.get('alerts_unchanged', False):
+                    alert_list = weather_data.get('alert_list', [])
+                    warning_text_cache.clear()
 
-                    warning_text = current_alert['event_upper']
-                    ticker_text_content = current_alert['ticker_text']
-
-                    if current_alert['alert_level'] == "ALERT":
-                        current_bar_texture, current_alert_level = alert_bar_texture, "ALERT"
-                    elif current_alert['alert_level'] == "WATCH":
-                        current_bar_texture, current_alert_level = watch_bar_texture, "WATCH"
-                    else:  # STATEMENT or ADVISORY
-                        current_bar_texture, current_alert_level = statement_bar_texture, "STATEMENT"
+                    current_bar_texture = None
+                    current_alert_level = None
 
-                    outline_width_px = max(1, scale_value(3, scaled_config["scale_y"]))
-                    ft_font_key = (scaled_config["TICKER_CONFIG"]["font_path"], scaled_config["TICKER_CONFIG"]["font_size"], False)
-                    if ft_font_key not in _font_cache:
-                        try:
-                            _font_cache[ft_font_key] = pygame.freetype.Font(ft_font_key[0], ft_font_key[1])
-                        except Exception:
-                            _font_cache[ft_font_key] = pygame.freetype.SysFont(None, ft_font_key[1])
-                    ft_font = _font_cache[ft_font_key]
-
-                    # Only recompute ticker surfaces/metrics when text or font key changes
-                    if ticker_text_content != prev_ticker_text or ft_font_key != prev_ticker_font_key:
-                        text_rect_ft = ft_font.get_rect(ticker_text_content)
-                        text_actual_width = text_rect_ft.width
-                        prev_ticker_text = ticker_text_content
-                        prev_ticker_font_key = ft_font_key
-
-                        ticker_surface = get_cached_warning_surface(
-                            ticker_text_content,
-                            scaled_config["TICKER_CONFIG"]["font_path"],
-                            scaled_config["TICKER_CONFIG"]["font_size"],
-                            scaled_config["TICKER_CONFIG"]["color"],
-                            (0, 0, 0),
-                            outline_width_px,
-                            False,
-                            ticker_text_cache
-                        )
-                        ticker_width = ticker_surface.get_width()
-                        prev_ticker_width = ticker_width
-                        prev_text_actual_width = text_actual_width
-                    else:
-                        # reuse previous values
-                        ticker_width = prev_ticker_width
-                        text_actual_width = prev_text_actual_width
+                    if alert_list:
+                        single_alert_mode = (len(alert_list) == 1)
+                        current_alert_index = 0
+                        ticker_scroll_count = 0
+                        current_alert = alert_list[current_alert_index]
+
+                        warning_text = current_alert['event_upper']
+                        ticker_text_content = current_alert['ticker_text']
+
+                        if current_alert['alert_level'] == "ALERT":
+                            current_bar_texture, current_alert_level = alert_bar_texture, "ALERT"
+                        elif current_alert['alert_level'] == "WATCH":
+                            current_bar_texture, current_alert_level = watch_bar_texture, "WATCH"
+                        else:  # STATEMENT or ADVISORY
+                            current_bar_texture, current_alert_level = statement_bar_texture, "STATEMENT"
+
+                        outline_width_px = max(1, scale_value(3, scaled_config["scale_y"]))
+                        ft_font_key = (scaled_config["TICKER_CONFIG"]["font_path"], scaled_config["TICKER_CONFIG"]["font_size"], False)
+                        if ft_font_key not in _font_cache:
+                            try:
+                                _font_cache[ft_font_key] = pygame.freetype.Font(ft_font_key[0], ft_font_key[1])
+                            except Exception:
+                                _font_cache[ft_font_key] = pygame.freetype.SysFont(None, ft_font_key[1])
+                        ft_font = _font_cache[ft_font_key]
+
+                        # Only recompute ticker surfaces/metrics when text or font key changes
+                        if ticker_text_content != prev_ticker_text or ft_font_key != prev_ticker_font_key:
+                            text_rect_ft = ft_font.get_rect(ticker_text_content)
+                            text_actual_width = text_rect_ft.width
+                            prev_ticker_text = ticker_text_content
+                            prev_ticker_font_key = ft_font_key
+
+                            ticker_surface = get_cached_warning_surface(
+                                ticker_text_content,
+                                scaled_config["TICKER_CONFIG"]["font_path"],
+                                scaled_config["TICKER_CONFIG"]["font_size"],
+                                scaled_config["TICKER_CONFIG"]["color"],
+                                (0, 0, 0),
+                                outline_width_px,
+                                False,
+                                ticker_text_cache
+                            )
+                            ticker_width = ticker_surface.get_width()
+                            prev_ticker_width = ticker_width
+                            prev_text_actual_width = text_actual_width
+                        else:
+                            # reuse previous values
+                            ticker_width = prev_ticker_width
+                            text_actual_width = prev_text_actual_width
 
-                    should_scroll = text_actual_width > scaled_config["TICKER_CONFIG"]["scroll_threshold"]
-                    ticker_x = SCREEN_WIDTH if should_scroll else (SCREEN_WIDTH - ticker_width) // 2
-                    ticker_start_time = pygame.time.get_ticks()
+                        should_scroll = text_actual_width > scaled_config["TICKER_CONFIG"]["scroll_threshold"]
+                        ticker_x = SCREEN_WIDTH if should_scroll else (SCREEN_WIDTH - ticker_width) // 2
+                        ticker_start_time = pygame.time.get_ticks()
                     
-                else:
-                    warning_text = " "
-                    ticker_surface = None
-                    current_bar_texture = None
-                    current_alert_level = None
-                    prev_ticker_text = None
-                    prev_ticker_font_key = None
-                    prev_ticker_width = 0
-                    prev_text_actual_width = 0
+                    else:
+                        warning_text = " "
+                        ticker_surface = None
+                        current_bar_texture = None
+                        current_alert_level = None
+                        prev_ticker_text = None
+                        prev_ticker_font_key = None
+                        prev_ticker_width = 0
+                        prev_text_actual_width = 0
 
                 forecast_periods_data = weather_data.get('forecast_periods')
-                if forecast_periods_data:
+                if forecast_periods_data and not (weather_data.get('forecast_unchanged', False) and pre_rendered_forecast_surface is not None):
                     pre_rendered_forecast_surface = create_forecast_panel_surface(
                         forecast_periods_data, scaled_config, SCREEN_WIDTH, panel_texture_cache,
                         weather_icon_cache, font_cache
@@ -3759,17 +5199,17 @@ def initialize_mini8s():
                 fade_start_time = 0
                 next_gif_idx = 0
                 gif_play_count = 0
-                radar_frames_raw = radar_gif_frames[0][:] if radar_gif_frames and radar_gif_frames[0] else []
+                radar_frames_raw = radar_gif_frames[0] if radar_gif_frames and radar_gif_frames[0] else []
                 create_all_pre_rendered_frames(
                     radar_frames_raw, pre_rendered_conditions_surface, pre_rendered_forecast_surface,
-                    title_text, mini8s_logo, logo_rect, current_bar_texture, warning_text,
-                    scaled_config, font_cache, PANEL_FLIP_ANIMATION_STEPS
+                    scaled_config, PANEL_FLIP_ANIMATION_STEPS
                 )
                 
                 if pending_alert_for_audio:
                     play_ticker_audio(pending_alert_for_audio, is_new_alert=True, radar_loaded=True)
                     pending_alert_for_audio = None
 
+                force_full_redraw = True
                 print("Main thread: Weather data update processed successfully")
             else:
                 title_text = "Oh great, where did we end up now?"
@@ -3791,9 +5231,9 @@ def initialize_mini8s():
                     current_gif_frame_idx = 0
                 # If we're on the last frame, use the real duration + 2000ms pause
                 if current_gif_frame_idx == last_frame_idx:
-                    frame_duration = max(50, durations[current_gif_frame_idx] // SPEED_FACTOR) + 1500
+                    frame_duration = int(max(50, durations[current_gif_frame_idx] // SPEED_FACTOR) * radar_loop_pace) + 1500
                 else:
-                    frame_duration = max(50, durations[current_gif_frame_idx] // SPEED_FACTOR)
+                    frame_duration = int(max(50, durations[current_gif_frame_idx] // SPEED_FACTOR) * radar_loop_pace)
                 if current_ticks_ms - last_gif_frame_time >= frame_duration:
                     # If we are about to loop from last frame to first, increment play count
                     if current_gif_frame_idx == last_frame_idx:
@@ -3814,22 +5254,21 @@ def initialize_mini8s():
                                 frames = radar_gif_frames[current_gif_idx]
                                 durations = radar_gif_durations[current_gif_idx]
                                 last_frame_idx = len(frames) - 1
-                                active_radar_frame = frames[0]
+                                active_radar_loop, active_radar_frame_idx = frames, 0
                                 # Skip the rest of the logic for this frame
                                 continue
                     current_gif_frame_idx = (current_gif_frame_idx + 1) % len(frames)
                     last_gif_frame_time = current_ticks_ms
-                # Only set active_radar_frame if not in a fade transition
+                # Only move the active radar frame on if not fading out
                 if not (is_tropical and num_gifs > 1 and fade_state in ["fading_out", "fading_in"]):
-                    active_radar_frame = frames[current_gif_frame_idx]
+                    active_radar_loop, active_radar_frame_idx = frames, current_gif_frame_idx
                 else:
-                    current_frame = frames[current_gif_frame_idx]
                     if fade_state != "fading_out":
-                        active_radar_frame = current_frame
+                        active_radar_loop, active_radar_frame_idx = frames, current_gif_frame_idx
             else:
-                active_radar_frame = None
+                active_radar_loop = None
         else:
-            active_radar_frame = None
+            active_radar_loop = None
 
         # Title fading for the 4hrradar stuffs.
         current_fade_alpha = 255
@@ -3843,7 +5282,7 @@ def initialize_mini8s():
                     last_gif_frame_time = current_ticks_ms
                     frames = radar_gif_frames[current_gif_idx]
                     durations = radar_gif_durations[current_gif_idx]
-                    active_radar_frame = frames[0]
+                    active_radar_loop, active_radar_frame_idx = frames, 0
                     fade_state = "fading_in"
                     fade_start_time = current_ticks_ms
                     current_fade_alpha = 0
@@ -3863,18 +5302,18 @@ def initialize_mini8s():
                     current_fade_alpha = int(255 * fade_progress)
                     current_fade_alpha = min(255, current_fade_alpha)
             
-        if active_radar_frame:
-            # Calculate radar offset with automatic scaling
-            base_offset = -75
-            base_height = 720
+        if active_radar_loop:
+            radar_changed_rects = radar_playback.show(active_radar_loop, active_radar_frame_idx)
+            active_radar_frame = radar_playback.canvas
+        else:
+            radar_changed_rects = None
+            active_radar_frame = None
 
-            # Different scaling for at or below 720p
-            if SCREEN_HEIGHT >= 720:
-                multiplier = 1.0 + ((SCREEN_HEIGHT - 720) * 0.3 / 360)
-            else:
-                multiplier = 1.0 - ((720 - SCREEN_HEIGHT) * 0.3 / 360)
-            radar_offset_y = int(base_offset * (SCREEN_HEIGHT / base_height) * multiplier) # Scaled offset
-            screen.blit(active_radar_frame, (0, radar_offset_y))
+        # Work out where everything goes this frame first; drawing is below, once per dirty rect.
+        location_dot_pos = None
+        if active_radar_frame:
+            # The frames already have this baked in, the dot still goes by it
+            radar_offset_y = get_radar_offset_y()
 
             # THE LOCAITON DOT.
             try:
@@ -3899,23 +5338,22 @@ def initialize_mini8s():
                 dot_x = SCREEN_WIDTH // 2 - location_dot_original.get_width() // 2
 
                 # This fucking dot.
-                if SCREEN_WIDTH == 896 and SCREEN_HEIGHT == 504:
+                if DISPLAY_WIDTH == 896 and DISPLAY_HEIGHT == 504:
                     dot_y = (SCREEN_HEIGHT // 2) + (radar_offset_y // 3) - location_dot_original.get_height() // 2
-                elif SCREEN_WIDTH == 1024 and SCREEN_HEIGHT == 600:
+                elif DISPLAY_WIDTH == 1024 and DISPLAY_HEIGHT == 600:
                     dot_y = (SCREEN_HEIGHT // 2) + (radar_offset_y // 2.5) - location_dot_original.get_height() // 2
-                elif SCREEN_WIDTH == 960 and SCREEN_HEIGHT == 540:
+                elif DISPLAY_WIDTH == 960 and DISPLAY_HEIGHT == 540:
                     dot_y = (SCREEN_HEIGHT // 2) + (radar_offset_y // 4.75) - location_dot_original.get_height() // 2
-                elif SCREEN_WIDTH == 1024 and SCREEN_HEIGHT == 576:
+                elif DISPLAY_WIDTH == 1024 and DISPLAY_HEIGHT == 576:
                     dot_y = (SCREEN_HEIGHT // 2) + (radar_offset_y // 5.45) - location_dot_original.get_height() // 2
                 else:
                     # For all other resolutions, use standard centering
                     dot_y = SCREEN_HEIGHT // 2 - location_dot_original.get_height() // 2
 
-                screen.blit(location_dot_original, (dot_x, dot_y))
+                location_dot_pos = (dot_x, int(dot_y))
             except Exception as e:
                 print(f"Error loading location dot: {e}")
-        else:
-                pass
+
         # Since images likely take less resources than gradient'd text.'
         if title_4hr_normal and title_4hr_tropical and title_4hr_redmode and title_4hr_tropical_redmode:
             if is_redmode and is_tropical and num_gifs > 1:
@@ -3937,7 +5375,7 @@ def initialize_mini8s():
 
             image_x = 10
             image_y = 10
-            screen.blit(title_image, (image_x, image_y))
+            title_blit = (title_image, (image_x, image_y))
         else:
             title_cache_key = (title_text, scaled_config["TITLE_CONFIG"]["font_size"])
             if title_cache_key not in gradient_title_cache:
@@ -3950,108 +5388,82 @@ def initialize_mini8s():
                     (255, 255, 255),
                     4
                 )
-            screen.blit(gradient_title_cache[title_cache_key], scaled_config["TITLE_CONFIG"]["position"])
-        screen.blit(mini8s_logo, logo_rect)
-        if current_bar_texture:
-            bar_rect = current_bar_texture.get_rect()
-            bar_rect.topleft = (0, SCREEN_HEIGHT - bar_rect.height)
-            screen.blit(current_bar_texture, bar_rect)
-            if warning_text and warning_text.strip():
-                        # Use cached pre-rendered surface instead of rendering each frame
-                        warning_surface = get_cached_warning_surface(
-                            warning_text,
-                            scaled_config["TKR_WARNING_TITLE_CONFIG"]["font_path"],
-                            scaled_config["TKR_WARNING_TITLE_CONFIG"]["font_size"],
-                            scaled_config["TKR_WARNING_TITLE_CONFIG"]["color"],
-                            (0, 0, 0),  # outline_color
-                            scale_value(4, scaled_config["scale_y"]),  # outline_width
-                            True,  # italic
-                            warning_text_cache
-                        )
-                        screen.blit(warning_surface, scaled_config["TKR_WARNING_TITLE_CONFIG"]["position"])
-
-        if is_transitioning and panel_to_blit_during_flip:
-            current_panel_w = panel_to_blit_during_flip.get_width()
-            blit_x = panel_render_pos_tuple[0] + (panel_original_width_for_centering - current_panel_w) // 2
-            screen.blit(panel_to_blit_during_flip, (blit_x, panel_render_pos_tuple[1]))
-        else:
-            if display_mode == "STABLE_CONDITIONS":
-                if pre_rendered_conditions_surface:
-                    screen.blit(pre_rendered_conditions_surface, panel_render_pos_tuple)
-            else:
-                if pre_rendered_forecast_surface:
-                    screen.blit(pre_rendered_forecast_surface, panel_render_pos_tuple)
-
-        if ticker_surface:
-            if should_scroll:
-                # Double scroll speed if more than 3 alerts
-                scroll_speed_multiplier = 1.5 if len(alert_list) > 3 else 1.0
-                ticker_x -= scaled_config["TICKER_CONFIG"]["scroll_speed"] * scroll_speed_multiplier * (clock.get_time() / 1000.0)
-
-                # Check if ticker has scrolled completely off screen
-                if ticker_x + ticker_width < 0:
-                    ticker_x = SCREEN_WIDTH
-                    if len(alert_list) > 1:
-                        ticker_scroll_count += 1
-                        # Always use 1 scroll when more than 3 alerts to cycle through them faster
-                        if len(alert_list) > 3:
-                            required_scrolls = 1
-                        elif len(alert_list) >= 3:
-                            required_scrolls = 1
+            title_blit = (gradient_title_cache[title_cache_key], scaled_config["TITLE_CONFIG"]["position"])
+
+        if ticker_surface and should_scroll:
+            # Double scroll speed if more than 3 alerts
+            scroll_speed_multiplier = 1.5 if len(alert_list) > 3 else 1.0
+            ticker_x -= scaled_config["TICKER_CONFIG"]["scroll_speed"] * scroll_speed_multiplier * (clock.get_time() / 1000.0)
+
+            # Check if ticker has scrolled completely off screen
+            if ticker_x + ticker_width < 0:
+                ticker_x = SCREEN_WIDTH
+                if len(alert_list) > 1:
+                    ticker_scroll_count += 1
+                    # Always use 1 scroll when more than 3 alerts to cycle through them faster
+                    if len(alert_list) > 3:
+                        required_scrolls = 1
+                    elif len(alert_list) >= 3:
+                        required_scrolls = 1
+                    else:
+                        required_scrolls = 2
+                    if ticker_scroll_count >= required_scrolls:
+                        ticker_scroll_count = 0
+                        force_full_redraw = True  # New bar colour and warning title
+                        current_alert_index = (current_alert_index + 1) % len(alert_list)
+                        current_alert = alert_list[current_alert_index]
+                        warning_text = current_alert['event_upper']
+                        ticker_text_content = current_alert['ticker_text']
+
+                        # Change bar color based on new alert type
+                        if current_alert['alert_level'] == "ALERT":
+                            current_bar_texture, current_alert_level = alert_bar_texture, "ALERT"
+                        elif current_alert['alert_level'] == "WATCH":
+                            current_bar_texture, current_alert_level = watch_bar_texture, "WATCH"
+                        else:  # STATEMENT or ADVISORY
+                            current_bar_texture, current_alert_level = statement_bar_texture, "STATEMENT"
+                        outline_width_px = max(1, scale_value(3, scaled_config["scale_y"]))
+                        ft_font_key = (scaled_config["TICKER_CONFIG"]["font_path"], scaled_config["TICKER_CONFIG"]["font_size"], False)
+                        if ft_font_key not in _font_cache:
+                            try:
+                                _font_cache[ft_font_key] = pygame.freetype.Font(ft_font_key[0], ft_font_key[1])
+                            except Exception:
+                                _font_cache[ft_font_key] = pygame.freetype.SysFont(None, ft_font_key[1])
+                        ft_font = _font_cache[ft_font_key]
+
+                        if ticker_text_content != prev_ticker_text or ft_font_key != prev_ticker_font_key:
+                            text_rect_ft = ft_font.get_rect(ticker_text_content)
+                            text_actual_width = text_rect_ft.width
+                            prev_ticker_text = ticker_text_content
+                            prev_ticker_font_key = ft_font_key
+
+                            ticker_surface = get_cached_warning_surface(
+                                ticker_text_content,
+                                scaled_config["TICKER_CONFIG"]["font_path"],
+                                scaled_config["TICKER_CONFIG"]["font_size"],
+                                scaled_config["TICKER_CONFIG"]["color"],
+                                (0, 0, 0),
+                                outline_width_px,
+                                False,
+                                ticker_text_cache
+                            )
+                            ticker_width = ticker_surface.get_width()
+                            prev_ticker_width = ticker_width
+                            prev_text_actual_width = text_actual_width
                         else:
-                            required_scrolls = 2
-                        if ticker_scroll_count >= required_scrolls:
-                            ticker_scroll_count = 0
-                            current_alert_index = (current_alert_index + 1) % len(alert_list)
-                            current_alert = alert_list[current_alert_index]
-                            warning_text = current_alert['event_upper']
-                            ticker_text_content = current_alert['ticker_text']
-
-                            # Change bar color based on new alert type
-                            if current_alert['alert_level'] == "ALERT":
-                                current_bar_texture, current_alert_level = alert_bar_texture, "ALERT"
-                            elif current_alert['alert_level'] == "WATCH":
-                                current_bar_texture, current_alert_level = watch_bar_texture, "WATCH"
-                            else:  # STATEMENT or ADVISORY
-                                current_bar_texture, current_alert_level = statement_bar_texture, "STATEMENT"
-                            outline_width_px = max(1, scale_value(3, scaled_config["scale_y"]))
-                            ft_font_key = (scaled_config["TICKER_CONFIG"]["font_path"], scaled_config["TICKER_CONFIG"]["font_size"], False)
-                            if ft_font_key not in _font_cache:
-                                try:
-                                    _font_cache[ft_font_key] = pygame.freetype.Font(ft_font_key[0], ft_font_key[1])
-                                except Exception:
-                                    _font_cache[ft_font_key] = pygame.freetype.SysFont(None, ft_font_key[1])
-                            ft_font = _font_cache[ft_font_key]
-
-                            if ticker_text_content != prev_ticker_text or ft_font_key != prev_ticker_font_key:
-                                text_rect_ft = ft_font.get_rect(ticker_text_content)
-                                text_actual_width = text_rect_ft.width
-                                prev_ticker_text = ticker_text_content
-                                prev_ticker_font_key = ft_font_key
-
-                                ticker_surface = get_cached_warning_surface(
-                                    ticker_text_content,
-                                    scaled_config["TICKER_CONFIG"]["font_path"],
-                                    scaled_config["TICKER_CONFIG"]["font_size"],
-                                    scaled_config["TICKER_CONFIG"]["color"],
-                                    (0, 0, 0),
-                                    outline_width_px,
-                                    False,
-                                    ticker_text_cache
-                                )
-                                ticker_width = ticker_surface.get_width()
-                                prev_ticker_width = ticker_width
-                                prev_text_actual_width = text_actual_width
-                            else:
-                                ticker_width = prev_ticker_width
-                                text_actual_width = prev_text_actual_width
+                            ticker_width = prev_ticker_width
+                            text_actual_width = prev_text_actual_width
 
-                            should_scroll = text_actual_width > scaled_config["TICKER_CONFIG"]["scroll_threshold"]
-                            ticker_x = SCREEN_WIDTH if should_scroll else (SCREEN_WIDTH - ticker_width) // 2
+                        should_scroll = text_actual_width > scaled_config["TICKER_CONFIG"]["scroll_threshold"]
+                        ticker_x = SCREEN_WIDTH if should_scroll else (SCREEN_WIDTH - ticker_width) // 2
                             
-                            # Play audio when ticker switches to display next alert
-                            play_ticker_audio(warning_text, is_new_alert=False, radar_loaded=True)
+                        # Play audio when ticker switches to display next alert
+                        play_ticker_audio(warning_text, is_new_alert=False, radar_loaded=True)
 
+
+        ticker_blit = None
+        ticker_strip = None
+        if ticker_surface:
             # So the text wont go out of bounds or clip out...
             ticker_y = scaled_config["TICKER_CONFIG"]["position_y"]
 
@@ -4072,6 +5484,7 @@ def initialize_mini8s():
             screen_rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
             ticker_rect = pygame.Rect(ticker_x, adjusted_ticker_y, ticker_width, ticker_surface.get_height())
             clipped_rect = ticker_rect.clip(screen_rect)
+            ticker_strip = pygame.Rect(0, adjusted_ticker_y, SCREEN_WIDTH, ticker_surface.get_height())
 
             if clipped_rect.width > 0 and clipped_rect.height > 0:
                 source_x = max(0, -ticker_x)
@@ -4081,21 +5494,98 @@ def initialize_mini8s():
                 blit_h = min(clipped_rect.height, available_h - source_y)
                 source_rect = pygame.Rect(source_x, source_y, clipped_rect.width, blit_h)
                 blit_y = clipped_rect.y
-                screen.blit(ticker_surface, (clipped_rect.x, blit_y), source_rect)
+                ticker_blit = ((clipped_rect.x, blit_y), source_rect)
+
+        # Say how old anything served from the store is, under the logo. Only changes once a minute.
+        new_data_age_text = describe_data_age(data_age, time.time() - data_age_since) if data_age else None
+        if new_data_age_text != data_age_text:
+            data_age_text = new_data_age_text
+            data_age_surface = None
+            if data_age_text:
+                data_age_surface = get_cached_warning_surface(
+                    data_age_text,
+                    scaled_config["TKR_WARNING_TITLE_CONFIG"]["font_path"],
+                    scale_font_size(24, scaled_config["scale_y"]),
+                    (255, 255, 255),
+                    (0, 0, 0),
+                    scale_value(2, scaled_config["scale_y"]),
+                    False,
+                    {}
+                )
+            force_full_redraw = True
+
+        # What goes over the radar, back to front: title, logo, data age, bar + warning title, panel. Each
+        # one is blitted as it is, a flipping panel gets drawn on its own after them.
+        overlay_parts = [title_blit]
+        if mini8s_logo:
+            overlay_parts.append((mini8s_logo, logo_rect))
+        if data_age_surface:
+            data_age_top = logo_rect.bottom if mini8s_logo else scaled_config["LOGO_CONFIG"]["margin_top"]
+            overlay_parts.append((data_age_surface, data_age_surface.get_rect(topright=(SCREEN_WIDTH - scaled_config["LOGO_CONFIG"]["margin_right"], data_age_top))))
+        if current_bar_texture:
+            overlay_parts.append((current_bar_texture, (0, SCREEN_HEIGHT - current_bar_texture.get_height())))
+            if warning_text and warning_text.strip():
+                # Use cached pre-rendered surface instead of rendering each frame
+                warning_surface = get_cached_warning_surface(
+                    warning_text,
+                    scaled_config["TKR_WARNING_TITLE_CONFIG"]["font_path"],
+                    scaled_config["TKR_WARNING_TITLE_CONFIG"]["font_size"],
+                    scaled_config["TKR_WARNING_TITLE_CONFIG"]["color"],
+                    (0, 0, 0),  # outline_color
+                    scale_value(4, scaled_config["scale_y"]),  # outline_width
+                    True,  # italic
+                    warning_text_cache
+                )
+                overlay_parts.append((warning_surface, scaled_config["TKR_WARNING_TITLE_CONFIG"]["position"]))
+        if not (is_transitioning and panel_to_blit_during_flip):
+            panel_surface = pre_rendered_conditions_surface if display_mode == "STABLE_CONDITIONS" else pre_rendered_forecast_surface
+            if panel_surface:
+                overlay_parts.append((panel_surface, panel_render_pos_tuple))
 
         # Render FPS counter if enabled
+        fps_blit = None
         if show_fps:
             current_fps = clock.get_fps()
             fps_text = f"FPS: {current_fps:.1f}"
             fps_color = (173, 216, 230)  # Baby blue color
             fps_surface = fps_font.render(fps_text, True, fps_color)
             fps_rect = fps_surface.get_rect(center=(SCREEN_WIDTH // 2, fps_font_size // 2 + 5))
-            screen.blit(fps_surface, fps_rect)
+            fps_blit = (fps_surface, fps_rect)
 
-        pygame.display.flip()
+        # Only the parts of the screen that changed get redrawn: the radar tiles that moved, the
+        # pulsing dot, the ticker strip and the FPS counter. Anything else changing redraws it all.
+        if (force_full_redraw or radar_changed_rects is None or is_transitioning or display_mode != drawn_display_mode
+                or fade_state != "normal" or current_fade_alpha < 255):
+            dirty_rects = None
+        else:
+            dirty_rects = [rect.move(active_radar_loop.position) for rect in radar_changed_rects]
+            if len(dirty_rects) > RADAR_MAX_DIRTY_RECTS:
+                dirty_rects = [dirty_rects[0].unionall(dirty_rects[1:])]
+            if location_dot_pos and saved_config.get("quality") != "verylow":
+                dirty_rects.append(location_dot_original.get_rect(topleft=location_dot_pos))
+            if ticker_strip and should_scroll:
+                dirty_rects.append(ticker_strip)
+            if fps_blit:
+                dirty_rects.append(fps_blit[1].union(drawn_fps_rect) if drawn_fps_rect else fps_blit[1])
+            dirty_rects = [rect.clip(screen.get_rect()) for rect in dirty_rects]
+            dirty_rects = [rect for rect in dirty_rects if rect.width and rect.height]
+
+        if dirty_rects is None:
+            draw_scene()
+        else:
+            for rect in dirty_rects:
+                screen.set_clip(rect)
+                draw_scene()
+            screen.set_clip(None)
+        force_full_redraw = False
+        drawn_display_mode = display_mode
+        drawn_fps_rect = fps_blit[1] if fps_blit else None
+
+        present_frame(screen, dirty_rects)
         clock.tick()  # VSync enabled: syncs to monitor refresh | VSync disabled: unlimited FPS
     print("Stopping thread...")
     stop_event.set()
+    init_stop_event.set()
     
     try:
         weather_timer.cancel()
@@ -4115,6 +5605,8 @@ def initialize_mini8s():
     sys.exit()
 
 if __name__ == "__main__":
+    # Needed for the radar decode processes in the frozen Windows/Linux binaries
+    multiprocessing.freeze_support()
     # Initialize PyQt5 application
     app = QApplication(sys.argv)
     # Use Oxygen style for Frutiger Aero look